@@ -0,0 +1,76 @@
+"""Compare the thread and asyncio engines of ``ghca batch`` on many short-lived, chatty children.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_batch_engines --folders 2000 --jobs 128 --lines 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import tempfile
+import threading
+import time
+
+from ghca.core.types import BatchEngine
+from ghca.services.batch import batch_run_command
+
+
+def _peak_threads(stop: threading.Event, peak: list[int]) -> None:
+    while not stop.wait(0.01):
+        peak[0] = max(peak[0], threading.active_count())
+
+
+def _run(engine: str, dest: str, args: argparse.Namespace) -> tuple[float, float, int]:
+    """Return (wall seconds, parent CPU seconds, peak thread count) for one engine."""
+    stop, peak = threading.Event(), [threading.active_count()]
+    sampler = threading.Thread(target=_peak_threads, args=(stop, peak), daemon=True)
+    sampler.start()
+    wall, cpu = time.perf_counter(), time.process_time()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        batch_run_command(
+            dest=dest,
+            cmd=["seq", "1", str(args.lines)],
+            only_git=False,
+            recursive=False,
+            only_globs=[],
+            exclude_globs=[],
+            jobs=args.jobs,
+            fail_fast=False,
+            dry_run=False,
+            shell=False,
+            extra_env=[],
+            stream=args.stream,
+            engine=engine,
+        )
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    stop.set()
+    sampler.join()
+    return wall, cpu, peak[0] - 1  # minus the sampler itself
+
+
+def main() -> None:
+    """Entry point."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--folders", type=int, default=2000)
+    ap.add_argument("--jobs", type=int, default=128)
+    ap.add_argument("--lines", type=int, default=200, help="Lines of output per child")
+    ap.add_argument("--stream", action="store_true", help="Benchmark --stream mode instead of capture")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="ghca-bench-batch-") as dest:
+        for i in range(args.folders):
+            os.mkdir(os.path.join(dest, f"folder-{i:05d}"))
+        print(f"{args.folders} folders, jobs={args.jobs}, {args.lines} lines each, stream={args.stream}")
+        for engine in BatchEngine:
+            wall, cpu, threads = _run(engine.value, dest, args)
+            print(
+                f"{engine.value:<8} {wall:7.2f}s wall  {cpu:7.2f}s parent CPU  "
+                f"{args.folders / wall:8.1f} folders/s  peak threads={threads}"
+            )
+
+
+if __name__ == "__main__":
+    main()
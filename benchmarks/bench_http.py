@@ -0,0 +1,53 @@
+"""Compare per-page wall time: a fresh urllib connection per call vs the pooled transport.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_http --repos 2000 --handshake-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import urllib.request
+
+from ghca.core.github_client import GitHubClient
+from ghca.core.http import HttpTransport
+
+from .fake_github import FakeGitHub, make_repo
+
+
+def _urllib_pages(api_base: str, org: str, pages: int) -> None:
+    for page in range(1, pages + 1):
+        url = f"{api_base}/orgs/{org}/repos?per_page=100&page={page}"
+        with urllib.request.urlopen(url, timeout=30) as resp:
+            json.loads(resp.read().decode("utf-8"))
+
+
+def _pooled_pages(api_base: str, org: str, pages: int) -> None:
+    gh = GitHubClient(api_base=api_base, transport=HttpTransport())
+    for page in range(1, pages + 1):
+        gh._request_json(f"{api_base}/orgs/{org}/repos?per_page=100&page={page}")
+
+
+def main() -> None:
+    """Entry point."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repos", type=int, default=2000)
+    ap.add_argument("--handshake-ms", type=float, default=20.0, help="Simulated per-connection setup cost")
+    args = ap.parse_args()
+
+    org = "bench-org"
+    repos = [make_repo(org, f"repo-{i:05d}") for i in range(args.repos)]
+    pages = -(-args.repos // 100)
+    for label, fn in (("urllib (new connection per page)", _urllib_pages), ("pooled transport", _pooled_pages)):
+        with FakeGitHub(org, repos, handshake_delay=args.handshake_ms / 1000) as fake:
+            start = time.perf_counter()
+            fn(fake.api_base, org, pages)
+            secs = time.perf_counter() - start
+            print(f"{label:<34} {pages} pages  {secs * 1000 / pages:7.2f} ms/page  connections={fake.connections}")
+
+
+if __name__ == "__main__":
+    main()
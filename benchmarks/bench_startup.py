@@ -0,0 +1,65 @@
+"""Time ``ghca`` startup (fresh interpreter each run) for a few cheap invocations.
+
+Each case runs the CLI in a new subprocess, the way scripts that call ``ghca`` in a loop do, and
+reports the median and best wall time. ``--max-ms`` turns it into a regression check: the exit
+status is 1 if any case's median is over the limit.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_startup --repeat 20
+    python -m benchmarks.bench_startup --repeat 20 --max-ms 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_ENTRY = "from ghca.cli.main import app; app()"
+
+
+def _cases(empty_dir: str) -> dict[str, list[str]]:
+    return {
+        "import": [sys.executable, "-c", "import ghca.cli.main"],
+        "--help": [sys.executable, "-c", _ENTRY, "--help"],
+        "status --help": [sys.executable, "-c", _ENTRY, "status", "--help"],
+        "batch --dry-run": [sys.executable, "-c", _ENTRY, "batch", "--dest", empty_dir, "--dry-run", "--", "true"],
+    }
+
+
+def _time_ms(argv: list[str], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Entry point."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=10, help="Runs per case; the median is reported")
+    ap.add_argument("--max-ms", type=float, help="Fail if any case's median startup exceeds this")
+    args = ap.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    failed = []
+    with tempfile.TemporaryDirectory(prefix="ghca-bench-") as tmp:
+        env = {**os.environ, "PYTHONPATH": root, "GHCA_CACHE_DIR": os.path.join(tmp, "cache")}
+        for name, argv in _cases(tmp).items():
+            _time_ms(argv, env)  # warm the OS file cache and .pyc files
+            runs = [_time_ms(argv, env) for _ in range(args.repeat)]
+            median = statistics.median(runs)
+            print(f"{name:<16} median {median:7.1f} ms  min {min(runs):7.1f} ms")
+            if args.max_ms is not None and median > args.max_ms:
+                failed.append(name)
+    if failed:
+        print(f"over {args.max_ms:g} ms: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
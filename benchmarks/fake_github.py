@@ -0,0 +1,208 @@
+"""Local stand-in for the parts of the GitHub REST API that ghca talks to.
+
+Serves ``GET /orgs/{org}/repos`` with GitHub-style pagination (``Link`` headers), release creation,
+lookup by tag and asset upload/delete over HTTP/1.1 keep-alive, gzip-encodes bodies when asked, and
+can add a per-connection delay to mimic the cost of a TCP/TLS handshake against the real API.
+Responses carry ``X-RateLimit-*`` headers drawn from a simulated hourly budget. Point ``clone_url``
+at local bare repos (see ``benchmarks.fleet``) to run whole commands offline.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+
+def make_repo(org: str, name: str, clone_url: str | None = None, **extra: Any) -> dict[str, Any]:
+    """Build a repo record shaped like the GitHub API's."""
+    return {
+        "name": name,
+        "full_name": f"{org}/{name}",
+        "clone_url": clone_url or f"https://github.com/{org}/{name}.git",
+        "ssh_url": f"git@github.com:{org}/{name}.git",
+        "archived": False,
+        "private": False,
+        "default_branch": "main",
+        "pushed_at": "2024-01-01T00:00:00Z",
+        **extra,
+    }
+
+
+class FakeGitHub:
+    """Threaded fake API server; use as a context manager and read ``api_base``."""
+
+    def __init__(
+        self, org: str, repos: list[dict[str, Any]], *, handshake_delay: float = 0.0, rate_limit: int = 5000
+    ) -> None:
+        self.org = org
+        self.repos = sorted(repos, key=lambda r: r["full_name"].lower())
+        self.handshake_delay = handshake_delay
+        self.requests = 0
+        self.rate_limit = rate_limit
+        self.rate_reset = int(time.time()) + 3600
+        self.releases: dict[str, list[dict[str, Any]]] = {}  # "owner/name" -> releases
+        self._ids = itertools.count(1)
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def api_base(self) -> str:
+        """Base URL to hand to ``GitHubClient(api_base=...)``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> FakeGitHub:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    # ---------- routing ----------
+    def _count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def _list_repos(self, path: str, query: dict[str, list[str]]) -> tuple[int, dict[str, str], Any]:
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        items = self.repos[(page - 1) * per_page : page * per_page]
+        last = max(1, -(-len(self.repos) // per_page))
+        headers: dict[str, str] = {}
+        links = []
+        if page < last:
+            links.append(f'<{self.api_base}{path}?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<{self.api_base}{path}?per_page={per_page}&page={last}>; rel="last"')
+        if links:
+            headers["Link"] = ", ".join(links)
+        return 200, headers, items
+
+    def _create_release(self, repo_full: str, payload: dict[str, Any]) -> tuple[int, dict[str, str], Any]:
+        with self._lock:
+            releases = self.releases.setdefault(repo_full, [])
+            if any(r["tag_name"] == payload.get("tag_name") for r in releases):
+                return 422, {}, {"message": "Validation Failed", "errors": [{"code": "already_exists"}]}
+            rid = next(self._ids)
+            release = {
+                "id": rid,
+                "tag_name": payload.get("tag_name"),
+                "name": payload.get("name"),
+                "body": payload.get("body") or ("generated notes" if payload.get("generate_release_notes") else ""),
+                "draft": bool(payload.get("draft")),
+                "prerelease": bool(payload.get("prerelease")),
+                "upload_url": f"{self.api_base}/uploads/repos/{repo_full}/releases/{rid}/assets{{?name,label}}",
+                "assets": [],
+            }
+            releases.append(release)
+        return 201, {}, release
+
+    def _find_release(self, repo_full: str, key: str, value: Any) -> dict[str, Any] | None:
+        return next((r for r in self.releases.get(repo_full, []) if r[key] == value), None)
+
+    def _upload_asset(self, repo_full: str, rid: int, name: str, body: bytes) -> tuple[int, dict[str, str], Any]:
+        with self._lock:
+            release = self._find_release(repo_full, "id", rid)
+            if release is None:
+                return 404, {}, {"message": "Not Found"}
+            if any(a["name"] == name for a in release["assets"]):
+                return 422, {}, {"message": "Validation Failed", "errors": [{"code": "already_exists"}]}
+            asset = {
+                "id": next(self._ids),
+                "name": name,
+                "size": len(body),
+                "digest": "sha256:" + hashlib.sha256(body).hexdigest(),
+                "state": "uploaded",
+            }
+            release["assets"].append(asset)
+        return 201, {}, asset
+
+    def _delete_asset(self, repo_full: str, asset_id: int) -> tuple[int, dict[str, str], Any]:
+        with self._lock:
+            for release in self.releases.get(repo_full, []):
+                for a in release["assets"]:
+                    if a["id"] == asset_id:
+                        release["assets"].remove(a)
+                        return 204, {}, None
+        return 404, {}, {"message": "Not Found"}
+
+    def route(
+        self, method: str, path: str, query: dict[str, list[str]], body: bytes = b""
+    ) -> tuple[int, dict[str, str], Any]:
+        """Return ``(status, headers, json_body)`` for a request."""
+        parts = path.strip("/").split("/")
+        if method == "GET" and len(parts) == 3 and parts[0] == "orgs" and parts[2] == "repos" and parts[1] == self.org:
+            return self._list_repos(path, query)
+        if len(parts) >= 4 and parts[0] == "repos" and parts[3] == "releases":
+            repo_full = f"{parts[1]}/{parts[2]}"
+            if method == "POST" and len(parts) == 4:
+                return self._create_release(repo_full, json.loads(body or b"{}"))
+            if method == "GET" and len(parts) == 4:
+                return 200, {}, list(reversed(self.releases.get(repo_full, [])))
+            if method == "PATCH" and len(parts) == 5 and parts[4].isdigit():
+                release = self._find_release(repo_full, "id", int(parts[4]))
+                if release is None:
+                    return 404, {}, {"message": "Not Found"}
+                release.update(json.loads(body or b"{}"))
+                return 200, {}, release
+            if method == "GET" and len(parts) == 6 and parts[4] == "tags":
+                # Like GitHub, the tag lookup only finds published releases.
+                release = self._find_release(repo_full, "tag_name", parts[5])
+                ok = release is not None and not release["draft"]
+                return (200, {}, release) if ok else (404, {}, {"message": "Not Found"})
+            if method == "DELETE" and len(parts) == 6 and parts[4] == "assets":
+                return self._delete_asset(repo_full, int(parts[5]))
+        if method == "POST" and len(parts) == 7 and parts[0] == "uploads" and parts[6] == "assets":
+            return self._upload_asset(f"{parts[2]}/{parts[3]}", int(parts[5]), query.get("name", [""])[0], body)
+        return 404, {}, {"message": "Not Found"}
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                fake._count("connections")
+                if fake.handshake_delay:
+                    time.sleep(fake.handshake_delay)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _dispatch(self) -> None:
+                fake._count("requests")
+                u = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                request_body = self.rfile.read(length) if length else b""
+                status, headers, payload = fake.route(self.command, u.path, parse_qs(u.query), request_body)
+                body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    headers = {**headers, "Content-Encoding": "gzip"}
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-RateLimit-Limit", str(fake.rate_limit))
+                self.send_header("X-RateLimit-Remaining", str(max(0, fake.rate_limit - fake.requests)))
+                self.send_header("X-RateLimit-Reset", str(fake.rate_reset))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+        return Handler
@@ -0,0 +1,91 @@
+"""Generate a fleet of local bare repositories for offline benchmarks.
+
+Every repo gets the same deterministic history (fixed content, authors and dates), so a fleet built
+on one machine or commit is byte-for-byte the one built on another and timings stay comparable.
+
+Run from the repo root to build one by hand:
+
+    python -m benchmarks.fleet /tmp/fleet --repos 200 --files 50 --file-kb 8 --commits 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+
+_EPOCH = 1_700_000_000
+
+
+def _fast_import_stream(files: int, file_kb: int, commits: int, seed: int) -> bytes:
+    """Build a ``git fast-import`` stream of ``commits`` commits, each rewriting a slice of ``files`` text files."""
+    rng = random.Random(seed)
+    out: list[bytes] = []
+    mark = 0
+    per_commit = max(1, -(-files // commits))
+    for c in range(commits):
+        changed = range(files) if c == 0 else rng.sample(range(files), min(per_commit, files))
+        blobs: list[tuple[int, str]] = []
+        for i in changed:
+            mark += 1
+            # Hex text lines: source-like (diffable, compressible about 2:1) rather than random binary.
+            data = "\n".join(rng.randbytes(32).hex() for _ in range(file_kb * 16)).encode() + b"\n"
+            out.append(b"blob\nmark :%d\ndata %d\n%s\n" % (mark, len(data), data))
+            blobs.append((mark, f"src/mod_{i:04d}.txt"))
+        message = f"commit {c + 1}".encode()
+        stamp = f"Bench <bench@example.com> {_EPOCH + c * 3600} +0000".encode()
+        out.append(b"commit refs/heads/main\nauthor %s\ncommitter %s\n" % (stamp, stamp))
+        out.append(b"data %d\n%s\n" % (len(message), message))
+        out.extend(b"M 100644 :%d %s\n" % (m, p.encode()) for m, p in blobs)
+        out.append(b"\n")
+    return b"".join(out)
+
+
+def make_bare_repo(path: str, *, files: int = 20, file_kb: int = 4, commits: int = 3, seed: int = 0) -> str:
+    """Create a bare repo at path with a deterministic ``main`` history; return path."""
+    subprocess.run(["git", "init", "--bare", "--quiet", path], check=True)
+    subprocess.run(["git", "-C", path, "symbolic-ref", "HEAD", "refs/heads/main"], check=True)
+    # Serve --filter requests (GitHub does), so partial clones from the fleet are really partial.
+    subprocess.run(["git", "-C", path, "config", "uploadpack.allowFilter", "true"], check=True)
+    stream = _fast_import_stream(files, file_kb, max(1, commits), seed)
+    subprocess.run(["git", "-C", path, "fast-import", "--quiet"], input=stream, check=True)
+    return path
+
+
+def make_fleet(root: str, count: int, *, files: int = 20, file_kb: int = 4, commits: int = 3) -> list[str]:
+    """Create ``count`` identical bare repos ``root/repo-NNNNN.git``; return their paths.
+
+    One template repo is built with ``git fast-import`` and copied, so even large fleets are quick
+    to generate. Existing repos are kept, which lets several scenarios share a fleet.
+    """
+    os.makedirs(root, exist_ok=True)
+    template = os.path.join(root, f".template-{files}x{file_kb}k-{commits}c.git")
+    if not os.path.isdir(template):
+        make_bare_repo(template + ".tmp", files=files, file_kb=file_kb, commits=commits)
+        os.replace(template + ".tmp", template)
+    paths = []
+    for i in range(count):
+        path = os.path.join(root, f"repo-{i:05d}.git")
+        if not os.path.isdir(path):
+            shutil.copytree(template, path)
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    """Entry point."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("root")
+    ap.add_argument("--repos", type=int, default=100)
+    ap.add_argument("--files", type=int, default=20, help="Files per repo")
+    ap.add_argument("--file-kb", type=int, default=4, help="Approximate size of each file")
+    ap.add_argument("--commits", type=int, default=3, help="Commits of history per repo")
+    args = ap.parse_args()
+    paths = make_fleet(args.root, args.repos, files=args.files, file_kb=args.file_kb, commits=args.commits)
+    print(f"{len(paths)} bare repos under {args.root}")
+
+
+if __name__ == "__main__":
+    main()
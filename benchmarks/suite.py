@@ -0,0 +1,287 @@
+"""Offline benchmark suite: time clone, commit, release and batch across repo counts and ``--jobs``.
+
+Everything runs locally. The repos come from a generated fleet of bare repos (``benchmarks.fleet``)
+served as ``file://`` remotes, and the API calls go to ``benchmarks.fake_github``. Results are
+written as JSON along with the git commit and the machine they were measured on, so runs from
+different commits can be compared with ``--baseline``.
+
+Run from the repo root:
+
+    python -m benchmarks.suite --repos 20,100 --jobs 1,8 --repeat 3 --out bench.json
+    python -m benchmarks.suite --repos 20,100 --jobs 1,8 --repeat 3 --baseline bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from ghca.core.types import CacheMode, CloneFilter
+from ghca.services.batch import batch_run_command
+from ghca.services.clone import clone_org
+from ghca.services.commit import batch_commit_and_push
+from ghca.services.release import batch_create_releases
+
+from .fake_github import FakeGitHub, make_repo
+from .fleet import make_fleet
+
+ORG = "bench-org"
+SCENARIOS = ("clone", "commit", "release", "batch")
+_GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+@contextlib.contextmanager
+def _silenced() -> Iterator[None]:
+    """Send stdout/stderr (ours and the git children's) to /dev/null for the block."""
+    saved = [os.dup(1), os.dup(2)]
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            os.dup2(devnull.fileno(), 1)
+            os.dup2(devnull.fileno(), 2)
+            yield
+    finally:
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+        for fd in saved:
+            os.close(fd)
+
+
+def _git_revision() -> dict[str, Any]:
+    def _git(*args: str) -> str | None:
+        try:
+            return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {"commit": _git("rev-parse", "HEAD"), "dirty": bool(status) if status is not None else None}
+
+
+def _timed(fn: Callable[[], None]) -> float:
+    with _silenced():
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+
+
+def _worktrees(dest: str) -> list[str]:
+    return sorted(os.path.join(dest, n) for n in os.listdir(dest) if os.path.exists(os.path.join(dest, n, ".git")))
+
+
+def _run_once(
+    fleet: list[str], work: str, jobs: int, scenarios: list[str], *, asset_kb: int, clone_options: dict[str, Any]
+) -> dict[str, float]:
+    """One pass of the scenario chain (each step works on the tree the previous one left behind)."""
+    remotes = os.path.join(work, "remotes")
+    dest = os.path.join(work, "checkout")
+    # Pushes land in a scratch copy of the fleet so it stays pristine across passes.
+    for path in fleet:
+        shutil.copytree(path, os.path.join(remotes, os.path.basename(path)))
+    repos = [
+        make_repo(
+            ORG, os.path.basename(p)[: -len(".git")], clone_url="file://" + os.path.join(remotes, os.path.basename(p))
+        )
+        for p in fleet
+    ]
+    times: dict[str, float] = {}
+    with FakeGitHub(ORG, repos, rate_limit=1_000_000) as fake:
+        secs = _timed(
+            lambda: clone_org(
+                ORG,
+                dest,
+                None,
+                False,
+                False,
+                False,
+                False,
+                "all",
+                jobs=jobs,
+                api_base=fake.api_base,
+                **clone_options,
+            )
+        )
+        if len(_worktrees(dest)) != len(fleet):
+            raise RuntimeError(f"clone produced {len(_worktrees(dest))} of {len(fleet)} repos")
+        if "clone" in scenarios:
+            times["clone"] = secs
+
+        if "commit" in scenarios:
+            for d in _worktrees(dest):
+                with open(os.path.join(d, "CHANGELOG.txt"), "a") as f:
+                    f.write("bench\n")
+            times["commit"] = _timed(
+                lambda: batch_commit_and_push(dest, "bench", None, False, False, None, False, jobs=jobs)
+            )
+
+        if "release" in scenarios:
+            for d in _worktrees(dest):
+                name = os.path.basename(d)
+                subprocess.run(
+                    ["git", "-C", d, "remote", "set-url", "origin", f"https://github.com/{ORG}/{name}.git"], check=True
+                )
+                os.makedirs(os.path.join(d, "dist"), exist_ok=True)
+                with open(os.path.join(d, "dist", f"{name}-1.0.whl"), "wb") as f:
+                    f.write(os.urandom(asset_kb * 1024))
+            times["release"] = _timed(
+                lambda: batch_create_releases(
+                    dest=dest,
+                    tag="v1.0.0",
+                    title=None,
+                    notes_file=None,
+                    generate_notes=True,
+                    draft=False,
+                    prerelease=False,
+                    target=None,
+                    assets=["dist/*"],
+                    token="bench",
+                    since_last_tag_only=False,
+                    only_globs=[],
+                    exclude_globs=[],
+                    dry_run=False,
+                    auto_from_uv=False,
+                    tag_prefix="",
+                    tag_suffix="",
+                    jobs=jobs,
+                    api_base=fake.api_base,
+                )
+            )
+
+    if "batch" in scenarios:
+        times["batch"] = _timed(
+            lambda: batch_run_command(
+                dest=dest,
+                cmd=["git", "status", "--porcelain"],
+                only_git=True,
+                recursive=False,
+                only_globs=[],
+                exclude_globs=[],
+                jobs=jobs,
+                fail_fast=False,
+                dry_run=False,
+                shell=False,
+                extra_env=[],
+            )
+        )
+    return times
+
+
+def _compare(results: list[dict[str, Any]], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    before = {(r["scenario"], r["repos"], r["jobs"]): r["median_sec"] for r in baseline["results"]}
+    print(f"\nvs {baseline_path} (commit {(baseline.get('git') or {}).get('commit') or '?'}):")
+    for r in results:
+        old = before.get((r["scenario"], r["repos"], r["jobs"]))
+        if old:
+            print(
+                f"  {r['scenario']:<8} repos={r['repos']:<5} jobs={r['jobs']:<3} "
+                f"{old:8.3f}s -> {r['median_sec']:8.3f}s  ({old / r['median_sec']:.2f}x)"
+            )
+
+
+def main() -> None:
+    """Entry point."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repos", default="20,100", help="Comma-separated repo counts")
+    ap.add_argument("--jobs", default="1,8", help="Comma-separated --jobs values")
+    ap.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="Comma-separated subset of " + ", ".join(SCENARIOS)
+    )
+    ap.add_argument("--repeat", type=int, default=3, help="Passes per combination; the median is reported")
+    ap.add_argument("--files", type=int, default=20, help="Files per generated repo")
+    ap.add_argument("--file-kb", type=int, default=4, help="Approximate size of each file")
+    ap.add_argument("--commits", type=int, default=3, help="Commits of history per generated repo")
+    ap.add_argument("--asset-kb", type=int, default=256, help="Size of the release asset per repo")
+    ap.add_argument(
+        "--filter", default=CloneFilter.full.value, choices=[f.value for f in CloneFilter], help="Clone mode"
+    )
+    ap.add_argument(
+        "--mirror-cache",
+        choices=[m.value for m in CacheMode],
+        help="Clone through a mirror cache shared by all passes (the first pass of each size warms it)",
+    )
+    ap.add_argument("--fleet-dir", help="Keep the generated fleet here and reuse it (default: a temp dir)")
+    ap.add_argument("--out", help="Write results as JSON to this file")
+    ap.add_argument("--baseline", help="Compare against a previous --out file")
+    args = ap.parse_args()
+
+    counts = [int(n) for n in args.repos.split(",")]
+    jobs_values = [int(n) for n in args.jobs.split(",")]
+    scenarios = [s for s in args.scenarios.split(",") if s]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        ap.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    for k, v in _GIT_IDENTITY.items():
+        os.environ.setdefault(k, v)
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="ghca-bench-") as tmp:
+        fleet_root = os.path.join(
+            args.fleet_dir or os.path.join(tmp, "fleet"), f"{args.files}x{args.file_kb}k-{args.commits}c"
+        )
+        clone_options: dict[str, Any] = {"clone_filter": args.filter}
+        if args.mirror_cache:
+            clone_options.update(mirror_cache_dir=os.path.join(tmp, "mirrors"), mirror_cache_mode=args.mirror_cache)
+        fleet_all = make_fleet(fleet_root, max(counts), files=args.files, file_kb=args.file_kb, commits=args.commits)
+        for count in counts:
+            for jobs in jobs_values:
+                runs: dict[str, list[float]] = {s: [] for s in scenarios}
+                for i in range(args.repeat):
+                    work = os.path.join(tmp, f"run-{count}-{jobs}-{i}")
+                    times = _run_once(
+                        fleet_all[:count], work, jobs, scenarios, asset_kb=args.asset_kb, clone_options=clone_options
+                    )
+                    for scenario, secs in times.items():
+                        runs[scenario].append(secs)
+                    shutil.rmtree(work)
+                for scenario in scenarios:
+                    median = statistics.median(runs[scenario])
+                    results.append(
+                        {
+                            "scenario": scenario,
+                            "repos": count,
+                            "jobs": jobs,
+                            "runs_sec": [round(s, 4) for s in runs[scenario]],
+                            "median_sec": round(median, 4),
+                            "min_sec": round(min(runs[scenario]), 4),
+                            "repos_per_sec": round(count / median, 2),
+                        }
+                    )
+                    print(
+                        f"{scenario:<8} repos={count:<5} jobs={jobs:<3} "
+                        f"median {median:8.3f}s  {count / median:8.1f} repos/s"
+                    )
+
+    report = {
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("out", "baseline", "fleet_dir")},
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    if args.baseline:
+        _compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import os
+
 import typer
 
-from ...config.settings import get_settings
-from ...services.batch import batch_run_command
+from ...core.types import BatchEngine, OutputFormat
 
 app = typer.Typer(add_completion=False)
 
@@ -19,10 +20,37 @@ def batch(
     only: str | None = typer.Option(None, "--only", help="Comma-separated folder globs to include"),
     exclude: str | None = typer.Option(None, "--exclude", help="Comma-separated folder globs to exclude"),
     jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Parallel jobs"),
-    fail_fast: bool = typer.Option(False, "--fail-fast", help="Stop after first failure"),
+    fail_fast: bool = typer.Option(
+        False, "--fail-fast", help="After the first failure, cancel queued jobs and stop running ones"
+    ),
+    timeout: float | None = typer.Option(None, "--timeout", min=0.1, help="Stop a job after this many seconds"),
+    engine: BatchEngine = typer.Option(  # noqa: B008
+        BatchEngine.thread,
+        "--engine",
+        case_sensitive=False,
+        help="thread: a thread per job; asyncio: one event loop (fewer threads, faster with --stream)",
+    ),
+    cache: bool = typer.Option(False, "--cache", help="Replay stored results for git repos whose content is unchanged"),
+    cache_env: list[str] = typer.Option(  # noqa: B008
+        None, "--cache-env", help="Env var whose value is part of the cache key (repeatable)", show_default=False
+    ),
+    cache_max_mb: int | None = typer.Option(
+        None, "--cache-max-mb", min=1, help="Evict least recently used results past this size (default 256)"
+    ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Print actions without executing"),
     shell: bool = typer.Option(False, "--shell", help="Run the command via the system shell"),
     env: list[str] = typer.Option(None, "--env", help="Extra env KEY=VAL (repeatable)"),
+    stream: bool = typer.Option(False, "--stream", help="Print output live, each line prefixed with the folder name"),
+    tail: int = typer.Option(
+        50, "--tail", min=1, help="Lines of output kept per failed folder (with --stream/--log-dir)"
+    ),
+    log_dir: str | None = typer.Option(None, "--log-dir", help="Write each folder's full output to <dir>/<folder>.log"),
+    output_format: OutputFormat = typer.Option(  # noqa: B008
+        OutputFormat.text,
+        "--format",
+        case_sensitive=False,
+        help="text: one line per repo; ndjson: a JSON record per repo",
+    ),
 ):
     """Run a command across folders in --dest.
 
@@ -30,11 +58,28 @@ def batch(
       ghca batch -- ls -1
       ghca batch --only 'repo-*' -- echo running
       ghca batch --only-git --jobs 4 -- bash -lc 'git status -s'
+      ghca batch --only-git --jobs 16 --stream --log-dir logs/ -- make test
+      ghca batch --engine asyncio --stream --jobs 256 -- git gc --auto
+      ghca batch --only-git --cache --cache-env PYTHON_VERSION -- uv run ruff check
 
     """
-    s = get_settings()
+    from dotenv import load_dotenv
+
+    from ...services.batch import batch_run_command
+
+    load_dotenv()  # the command's environment includes .env, like every other command's
+    cache_dir = None
+    if not dest or cache:
+        # Settings (and pydantic) load only when a default is needed, so `batch --dest DIR` starts fast.
+        from ...config.settings import get_settings
+
+        s = get_settings()
+        dest = dest or s.default_dest
+        if cache:
+            cache_dir = os.path.join(s.cache_dir, "batch")
+            cache_max_mb = cache_max_mb or s.batch_cache_max_mb
     batch_run_command(
-        dest=dest or s.default_dest,
+        dest=dest,
         cmd=cmd,
         only_git=only_git,
         recursive=recursive,
@@ -45,4 +90,13 @@ def batch(
         dry_run=dry_run,
         shell=shell,
         extra_env=env or [],
+        stream=stream,
+        tail_lines=tail,
+        log_dir=log_dir,
+        timeout=timeout,
+        engine=engine.value,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb or 0,  # only read when cache_dir is set
+        cache_env=cache_env or [],
+        output_format=output_format.value,
     )
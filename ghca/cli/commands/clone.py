@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import os
+
 import typer
 
-from ...config.settings import get_settings
-from ...core.types import Visibility
-from ...services.clone import clone_org
+from ...core.constants import PAGE_FETCH_CONCURRENCY
+from ...core.types import CacheMode, CloneFilter, OutputFormat, Visibility
 
 app = typer.Typer(add_completion=False)
 
@@ -21,13 +22,63 @@ def clone(
     shallow: bool = typer.Option(False, "--shallow", help="Shallow clones (depth 1)"),
     include_archived: bool = typer.Option(False, "--include-archived", help="Include archived repos"),
     visibility: Visibility = typer.Option(Visibility.all, case_sensitive=False),  # noqa: B008
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Parallel clones"),
+    max_connections: int | None = typer.Option(
+        None, "--max-connections", min=1, help="Max concurrent transfers from the remote host (default: --jobs)"
+    ),
+    page_jobs: int = typer.Option(
+        PAGE_FETCH_CONCURRENCY, "--page-jobs", min=1, help="Concurrent API requests when listing repos"
+    ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk API response cache"),
+    clone_filter: CloneFilter = typer.Option(  # noqa: B008
+        CloneFilter.full,
+        "--filter",
+        case_sensitive=False,
+        help="full; blobless: fetch file contents on demand; treeless: fetch trees and contents on demand",
+    ),
+    sparse: list[str] = typer.Option(  # noqa: B008
+        None,
+        "--sparse",
+        help="Only check out this directory (repeatable; cone-mode sparse checkout)",
+        show_default=False,
+    ),
+    mirror_cache: CacheMode | None = typer.Option(  # noqa: B008
+        None,
+        "--mirror-cache",
+        case_sensitive=False,
+        help="Fetch into a persistent local mirror per repo, then check out from it: "
+        "dissociate (copy its objects; safest), reference (share them), worktree (detached git worktree)",
+    ),
+    mirror_cache_dir: str | None = typer.Option(
+        None, "--mirror-cache-dir", help="Mirror cache location (default: <cache dir>/mirrors)"
+    ),
+    mirror_cache_max_mb: int | None = typer.Option(
+        None, "--mirror-cache-max-mb", min=1, help="Evict least recently used mirrors past this size (default 10240)"
+    ),
+    retries: int = typer.Option(
+        2, "--retries", min=0, help="Retry a clone that failed on a network error this many times"
+    ),
+    retry_backoff: float = typer.Option(
+        2.0, "--retry-backoff", min=0.0, help="Seconds before the first retry; doubles for each further one"
+    ),
+    output_format: OutputFormat = typer.Option(  # noqa: B008
+        OutputFormat.text,
+        "--format",
+        case_sensitive=False,
+        help="text: one line per repo; ndjson: a JSON record per repo",
+    ),
 ):
     """Typer command to clone all repositories for an organisation."""
+    from ...config.settings import get_settings
+    from ...services.clone import clone_org
+
     s = get_settings()
     _dest = dest or s.default_dest
     _token = token if token is not None else s.github_token
     if visibility != Visibility.public and not _token:
         typer.echo("Warning: no token provided; only public repos will be visible.", err=True)
+    if mirror_cache and (mirror or shallow or clone_filter != CloneFilter.full):
+        raise typer.BadParameter("--mirror-cache cannot be combined with --mirror, --shallow or --filter")
 
     clone_org(
         org=org,
@@ -38,4 +89,18 @@ def clone(
         shallow=shallow,
         include_archived=include_archived,
         visibility=visibility.value,
+        jobs=jobs,
+        max_connections=max_connections,
+        api_base=s.github_api_base,
+        page_jobs=page_jobs,
+        http_cache_dir=None if no_cache else os.path.join(s.cache_dir, "http"),
+        http_cache_max_mb=s.http_cache_max_mb,
+        output_format=output_format.value,
+        clone_filter=clone_filter.value,
+        sparse=sparse or [],
+        mirror_cache_dir=(mirror_cache_dir or os.path.join(s.cache_dir, "mirrors")) if mirror_cache else None,
+        mirror_cache_mode=(mirror_cache or CacheMode.dissociate).value,
+        mirror_cache_max_mb=mirror_cache_max_mb or s.mirror_cache_max_mb,
+        retries=retries,
+        retry_backoff=retry_backoff,
     )
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from ...config.settings import get_settings
-from ...services.commit import batch_commit_and_push
+from ...core.types import OutputFormat
 
 app = typer.Typer(add_completion=False)
 
@@ -19,8 +18,19 @@ def commit(
     allow_empty: bool = typer.Option(False, "--allow-empty", help="Allow empty commits"),
     sign: bool = typer.Option(False, "--sign", help="GPG-sign commits if configured"),
     no_verify: bool = typer.Option(False, "--no-verify", help="Skip push hooks"),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Parallel local add/commit"),
+    push_jobs: int | None = typer.Option(None, "--push-jobs", min=1, help="Parallel pushes (default: --jobs)"),
+    output_format: OutputFormat = typer.Option(  # noqa: B008
+        OutputFormat.text,
+        "--format",
+        case_sensitive=False,
+        help="text: one line per repo; ndjson: a JSON record per repo",
+    ),
 ):
     """Typer command to run batch commit & push across repositories."""
+    from ...config.settings import get_settings
+    from ...services.commit import batch_commit_and_push
+
     s = get_settings()
     _dest = dest or s.default_dest
     _token = token if token is not None else s.github_token
@@ -33,4 +43,7 @@ def commit(
         sign=sign,
         token=_token,
         push_no_verify=no_verify,
+        jobs=jobs,
+        push_jobs=push_jobs,
+        output_format=output_format.value,
     )
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from ...config.settings import get_settings
-from ...services.discard import discard_changes_batch
+from ...core.types import OutputFormat
 
 app = typer.Typer(add_completion=False)
 
@@ -21,6 +20,13 @@ def discard(
     exclude: str | None = typer.Option(None, "--exclude", help="Comma-separated repo name globs to exclude"),
     all: bool = typer.Option(False, "--all", help="Do not skip clean repos (default skips clean)"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Print actions without executing"),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Repositories to discard in parallel"),
+    output_format: OutputFormat = typer.Option(  # noqa: B008
+        OutputFormat.text,
+        "--format",
+        case_sensitive=False,
+        help="text: one line per repo; ndjson: a JSON record per repo",
+    ),
 ):
     """Discard local changes across repositories.
 
@@ -30,8 +36,12 @@ def discard(
       ghca discard --clean --clean-ignored            # also remove untracked & ignored files
       ghca discard --mode mixed                       # reset --mixed (keeps worktree changes)
       ghca discard --dry-run                          # preview actions
+      ghca discard --clean --jobs 8                   # 8 repos at a time
 
     """
+    from ...config.settings import get_settings
+    from ...services.discard import discard_changes_batch
+
     s = get_settings()
     discard_changes_batch(
         dest=dest or s.default_dest,
@@ -43,4 +53,6 @@ def discard(
         exclude_globs=(exclude.split(",") if exclude else []),
         only_dirty=(not all),
         dry_run=dry_run,
+        jobs=jobs,
+        output_format=output_format.value,
     )
@@ -0,0 +1,30 @@
+"""CLI for the persistent repository index used by repo discovery."""
+
+from __future__ import annotations
+
+import typer
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def index(
+    dest: str | None = typer.Option(None, "--dest", help="Root folder of repositories"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Discard the index and rescan everything"),
+    max_depth: int | None = typer.Option(
+        None, "--max-depth", min=0, help="Max levels below dest to search (kept until the next --rebuild)"
+    ),
+    show: bool = typer.Option(False, "--list", help="List the indexed repositories"),
+):
+    """Refresh the repository index that commit/discard/release/batch --only-git use for discovery.
+
+    Examples:
+      ghca index --dest ../ --list
+      ghca index --dest ../ --rebuild --max-depth 2
+
+    """
+    from ...config.settings import get_settings
+    from ...services.index import index_repos
+
+    s = get_settings()
+    index_repos(dest=dest or s.default_dest, rebuild=rebuild, max_depth=max_depth, show=show)
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import typer
 
-from ...config.settings import get_settings
-from ...services.release import batch_create_releases
+from ...core.constants import ASSET_UPLOAD_CONCURRENCY
+from ...core.types import OutputFormat, ReleaseBackend
 
 app = typer.Typer(add_completion=False)
 
@@ -39,7 +39,25 @@ def release(
     since_last_tag_only: bool = typer.Option(False, "--since-last-tag-only", help="Skip if no commits since last tag"),
     only: str | None = typer.Option(None, "--only", help="Comma-separated repo globs to include (e.g. 'ab-*,tool-*')"),
     exclude: str | None = typer.Option(None, "--exclude", help="Comma-separated repo globs to exclude"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Print gh command without executing"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Print the release request without executing"),
+    backend: ReleaseBackend = typer.Option(  # noqa: B008
+        ReleaseBackend.api, "--backend", case_sensitive=False, help="api: in-process REST calls; gh: GitHub CLI"
+    ),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Repositories to release in parallel"),
+    asset_jobs: int = typer.Option(
+        ASSET_UPLOAD_CONCURRENCY, "--asset-jobs", min=1, help="Assets to upload in parallel per release (api backend)"
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Add missing assets to an already published release; differing ones are never replaced (api backend)",
+    ),
+    output_format: OutputFormat = typer.Option(  # noqa: B008
+        OutputFormat.text,
+        "--format",
+        case_sensitive=False,
+        help="text: one line per repo; ndjson: a JSON record per repo",
+    ),
 ):
     """Batch-create releases across repos.
 
@@ -53,7 +71,13 @@ def release(
       # Fixed tag:
       ghca release --tag v0.3.0 --generate-notes --dest ../
 
+      # Via the gh CLI instead of the REST API, 4 repos at a time:
+      ghca release --auto-from-uv --backend gh --jobs 4 --dest ../
+
     """
+    from ...config.settings import get_settings
+    from ...services.release import batch_create_releases
+
     s = get_settings()
 
     # Guard: require either fixed tag or auto mode
@@ -78,4 +102,10 @@ def release(
         auto_from_uv=auto_from_uv,
         tag_prefix=tag_prefix,
         tag_suffix=tag_suffix,
+        backend=backend.value,
+        jobs=jobs,
+        api_base=s.github_api_base,
+        asset_jobs=asset_jobs,
+        output_format=output_format.value,
+        resume=resume,
     )
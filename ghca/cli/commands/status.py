@@ -0,0 +1,37 @@
+"""CLI for a read-only status overview across repositories."""
+
+from __future__ import annotations
+
+import typer
+
+from ...core.constants import PROBE_CONCURRENCY
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def status(
+    dest: str | None = typer.Option(None, "--dest", help="Root folder of repositories"),
+    only: str | None = typer.Option(None, "--only", help="Comma-separated repo name globs to include"),
+    exclude: str | None = typer.Option(None, "--exclude", help="Comma-separated repo name globs to exclude"),
+    dirty: bool = typer.Option(False, "--dirty", help="Only list repos with local changes"),
+    jobs: int = typer.Option(PROBE_CONCURRENCY, "--jobs", "-j", min=1, help="Parallel probes"),
+):
+    """Show branch, upstream, ahead/behind and change counts for every repository.
+
+    Examples:
+      ghca status --dest ../
+      ghca status --dirty --only 'service-*'
+
+    """
+    from ...config.settings import get_settings
+    from ...services.status import status_table
+
+    s = get_settings()
+    status_table(
+        dest=dest or s.default_dest,
+        only_globs=(only.split(",") if only else []),
+        exclude_globs=(exclude.split(",") if exclude else []),
+        dirty_only=dirty,
+        jobs=jobs,
+    )
@@ -0,0 +1,80 @@
+"""CLI for incrementally syncing a checkout tree with an organisation."""
+
+from __future__ import annotations
+
+import os
+
+import typer
+
+from ...core.constants import PAGE_FETCH_CONCURRENCY
+from ...core.types import CloneFilter, Visibility
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def sync(
+    org: str = typer.Option(..., help="GitHub organisation login (e.g. 'pallets')"),
+    dest: str = typer.Option(None, help="Destination directory"),
+    token: str | None = typer.Option(None, help="GitHub PAT"),
+    ssh: bool = typer.Option(False, "--ssh", help="Use SSH URLs for new clones"),
+    mirror: bool = typer.Option(False, "--mirror", help="Tree holds --mirror clones"),
+    shallow: bool = typer.Option(False, "--shallow", help="Shallow new clones (depth 1)"),
+    include_archived: bool = typer.Option(False, "--include-archived", help="Include archived repos"),
+    visibility: Visibility = typer.Option(Visibility.all, case_sensitive=False),  # noqa: B008
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Parallel clones/fetches"),
+    max_connections: int | None = typer.Option(
+        None, "--max-connections", min=1, help="Max concurrent transfers from the remote host (default: --jobs)"
+    ),
+    force: bool = typer.Option(False, "--force", help="Fetch every repo, even if not pushed since last sync"),
+    page_jobs: int = typer.Option(
+        PAGE_FETCH_CONCURRENCY, "--page-jobs", min=1, help="Concurrent API requests when listing repos"
+    ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk API response cache"),
+    clone_filter: CloneFilter = typer.Option(  # noqa: B008
+        CloneFilter.full,
+        "--filter",
+        case_sensitive=False,
+        help="Partial mode for new clones (full, blobless, treeless)",
+    ),
+    sparse: list[str] = typer.Option(  # noqa: B008
+        None,
+        "--sparse",
+        help="Only check out this directory in new clones (repeatable; cone-mode sparse checkout)",
+        show_default=False,
+    ),
+):
+    """Clone new org repos and fetch only the ones pushed since the last sync.
+
+    Examples:
+      ghca sync --org auth-broker --dest ../ --jobs 8
+      ghca sync --org auth-broker --dest ../ --force     # fetch everything
+
+    """
+    from ...config.settings import get_settings
+    from ...services.sync import sync_org
+
+    s = get_settings()
+    _token = token if token is not None else s.github_token
+    if visibility != Visibility.public and not _token:
+        typer.echo("Warning: no token provided; only public repos will be visible.", err=True)
+
+    sync_org(
+        org=org,
+        dest=dest or s.default_dest,
+        token=_token,
+        ssh=ssh,
+        mirror=mirror,
+        shallow=shallow,
+        include_archived=include_archived,
+        visibility=visibility.value,
+        jobs=jobs,
+        max_connections=max_connections,
+        force=force,
+        api_base=s.github_api_base,
+        page_jobs=page_jobs,
+        http_cache_dir=None if no_cache else os.path.join(s.cache_dir, "http"),
+        http_cache_max_mb=s.http_cache_max_mb,
+        clone_filter=clone_filter.value,
+        sparse=sparse or [],
+    )
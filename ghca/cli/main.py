@@ -1,18 +1,61 @@
 """CLI entrypoint that wires subcommands into a Typer app."""
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperCommand, TyperGroup
+
+from ..core import trace
+
+# name -> (module defining a one-command ``app``, short help shown by ``ghca --help``)
+_COMMANDS = {
+    "clone": ("ghca.cli.commands.clone", "Clone all org repositories"),
+    "sync": ("ghca.cli.commands.sync", "Incrementally sync a checkout tree with the org"),
+    "commit": ("ghca.cli.commands.commit", "Batch commit & push across repos"),
+    "release": ("ghca.cli.commands.release", "Release all repositories"),
+    "batch": ("ghca.cli.commands.batch", "Batch commands across all repositories"),
+    "discard": ("ghca.cli.commands.discard", "Discard local changes across all repositories"),
+    "status": ("ghca.cli.commands.status", "Show a status table across all repositories"),
+    "index": ("ghca.cli.commands.index", "Inspect or rebuild the repository index"),
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Lists subcommands from ``_COMMANDS`` and imports one only when it is invoked.
+
+    ``ghca --help`` then loads no command modules, and ``ghca batch`` loads only batch's service
+    and its dependencies, not every command's. (Click types are left as ``Any``: depending on the
+    Typer version, click is a separate package or vendored inside Typer.)
+    """
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return list(_COMMANDS)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name in _COMMANDS and cmd_name not in self.commands:
+            # Enough for help listings; resolve_command loads the real thing before it runs.
+            return TyperCommand(cmd_name, help=_COMMANDS[cmd_name][1])
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(self, ctx: Any, args: list[str]) -> Any:
+        if args and args[0] in _COMMANDS and args[0] not in self.commands:
+            module = importlib.import_module(_COMMANDS[args[0]][0])
+            self.add_command(typer.main.get_command(module.app), args[0])
+        return super().resolve_command(ctx, args)
 
-from .commands.batch import app as batch_app
-from .commands.clone import app as clone_app
-from .commands.commit import app as commit_app
-from .commands.discard import app as discard_app
-from .commands.release import app as release_app
 
-app = typer.Typer(add_completion=False, help="Clone/update/commit/push across an org's GitHub repos.")
+app = typer.Typer(add_completion=False, cls=_LazyGroup, help="Clone/update/commit/push across an org's GitHub repos.")
 
 
-app.add_typer(clone_app, help="Clone all org repositories")
-app.add_typer(commit_app, help="Batch commit & push across repos")
-app.add_typer(release_app, help="Release all repositories")
-app.add_typer(batch_app, help="Batch commands across all repositories")
-app.add_typer(discard_app, help="Discard local changes across all repositories")
+@app.callback()
+def main(
+    ctx: typer.Context,
+    trace_file: str | None = typer.Option(
+        None, "--trace", metavar="FILE", help="Write a Chrome/Perfetto trace of subprocess and HTTP spans to FILE"
+    ),
+):
+    """Options shared by every subcommand."""
+    if trace_file:
+        trace.start(trace_file)
+        ctx.call_on_close(trace.stop)
@@ -1,13 +1,14 @@
 """Configuration helpers for loading environment-backed settings."""
 
+import functools
 import os
 
 from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load .env once, early
-load_dotenv()
+from ..core.constants import API_BASE
+from ..core.utils import default_cache_dir
 
 
 class Settings(BaseSettings):
@@ -17,9 +18,16 @@ class Settings(BaseSettings):
 
     github_token: str | None = Field(default_factory=lambda: os.getenv("GITHUB_TOKEN"))
     default_dest: str = Field(default="repos")
+    # GITHUB_API_URL is what Actions runners export; also handy for pointing at a local stand-in server.
+    github_api_base: str = Field(default_factory=lambda: os.getenv("GITHUB_API_URL") or API_BASE)
+    cache_dir: str = Field(default_factory=default_cache_dir)
+    http_cache_max_mb: int = Field(default=64)
+    batch_cache_max_mb: int = Field(default=256)
+    mirror_cache_max_mb: int = Field(default=10240)
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return a Settings instance (constructed each call)."""
-    # simple singleton pattern if you want; for now just construct
+    """Return the process-wide Settings, loading ``.env`` on first use (``get_settings.cache_clear()`` to reload)."""
+    load_dotenv()
     return Settings()
@@ -0,0 +1,76 @@
+"""Run journal that lets an interrupted or partly failed ``ghca clone`` pick up where it stopped."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any
+
+from .types import CloneState
+
+
+class CloneJournal:
+    """Per-repo clone state (pending, in-progress, done, failed), appended to a file as it changes.
+
+    Each change is one JSON line, flushed immediately, so a killed run loses nothing and updates stay
+    O(1) however many repos there are. Loading replays the lines (last one wins, a torn final line is
+    ignored); ``compact`` rewrites the file atomically with just the latest state per repo.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        torn = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    torn = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry["repo"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        self._file = open(path, "a", encoding="utf-8")
+        if torn:
+            self._file.write("\n")  # so the next record does not run into the cut-off one
+
+    def state(self, repo: str) -> str | None:
+        """Last recorded state of repo, or None if this journal has never seen it."""
+        entry = self.entries.get(repo)
+        return entry["state"] if entry else None
+
+    def counts(self) -> dict[str, int]:
+        """Count the repos in each state."""
+        out = {s.value: 0 for s in CloneState}
+        for entry in self.entries.values():
+            out[entry["state"]] = out.get(entry["state"], 0) + 1
+        return out
+
+    def record(self, repo: str, state: CloneState, **details: Any) -> None:
+        """Record repo's new state (with e.g. ``attempts``/``error``) and flush it to disk."""
+        entry = {"repo": repo, "state": state.value, **details}
+        with self._lock:
+            self.entries[repo] = entry
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._file.flush()
+
+    def compact(self) -> None:
+        """Rewrite the journal with one line per repo (its latest state)."""
+        with self._lock:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", prefix=".ghca-clone-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for name in sorted(self.entries):
+                    f.write(json.dumps(self.entries[name], separators=(",", ":")) + "\n")
+            self._file.close()
+            os.replace(tmp, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            self._file.close()
@@ -4,3 +4,12 @@ API_BASE = "https://api.github.com"
 GITHUB_API_ACCEPT = "application/vnd.github+json"
 USER_AGENT = "ghca/0.2"
 HTTP_TIMEOUT_SEC = 30
+PAGE_FETCH_CONCURRENCY = 4
+API_MAX_INFLIGHT = 8
+RATE_LIMIT_RESERVE = 100
+SYNC_STATE_FILE = ".ghca-sync.json"
+PROBE_CONCURRENCY = 8
+ASSET_UPLOAD_CONCURRENCY = 4
+CLONE_JOURNAL_FILE = ".ghca-clone.journal"
+# Clones are built here (under dest) and renamed into place when complete; discovery skips it.
+CLONE_STAGING_DIR = ".ghca-partial"
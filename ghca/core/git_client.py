@@ -2,61 +2,405 @@
 
 from __future__ import annotations
 
+import collections
+import hashlib
 import os
 import re
+import shutil
+import stat
 import subprocess
 import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from urllib.parse import urlparse
 
+from . import trace
+from .constants import CLONE_STAGING_DIR, PROBE_CONCURRENCY
 from .github_client import GitHubClient
+from .mirror_cache import MirrorCache
+from .repo_index import RepoIndex
+from .types import CacheMode, CloneFilter, RepoState
+from .utils import default_cache_dir
+
+_CONFIG_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_CONFIG_KEY_RE = re.compile(r"^([A-Za-z][A-Za-z0-9-]*)\s*(?:=\s*(.*))?$")
+# git --filter spec for each partial CloneFilter mode.
+_FILTER_SPECS = {CloneFilter.blobless.value: "blob:none", CloneFilter.treeless.value: "tree:0"}
+
+
+def _config_value(raw: str) -> str | None:
+    """Decode a git-config value; None if it uses syntax we leave to git (continuations)."""
+    out: list[str] = []
+    quoted = False
+    i = 0
+    while i < len(raw):
+        c = raw[i]
+        if c == "\\":
+            if i + 1 >= len(raw):
+                return None  # line continuation
+            out.append({"n": "\n", "t": "\t", "b": "\b"}.get(raw[i + 1], raw[i + 1]))
+            i += 2
+            continue
+        if c == '"':
+            quoted = not quoted
+        elif c in "#;" and not quoted:
+            break
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out).strip()
+
+
+def _parse_status_v2(out: bytes) -> RepoState:
+    branch = oid = upstream = None
+    ahead = behind = staged = unstaged = untracked = conflicts = 0
+    records = out.decode("utf-8", "surrogateescape").split("\0")
+    i = 0
+    while i < len(records):
+        rec = records[i]
+        i += 1
+        if rec.startswith("# branch.oid "):
+            value = rec[len("# branch.oid ") :]
+            oid = None if value == "(initial)" else value
+        elif rec.startswith("# branch.head "):
+            value = rec[len("# branch.head ") :]
+            branch = None if value == "(detached)" else value
+        elif rec.startswith("# branch.upstream "):
+            upstream = rec[len("# branch.upstream ") :]
+        elif rec.startswith("# branch.ab "):
+            a, _, b = rec[len("# branch.ab ") :].partition(" ")
+            ahead, behind = abs(int(a)), abs(int(b))
+        elif rec[:2] in {"1 ", "2 "}:
+            xy = rec[2:4]
+            staged += xy[0] != "."
+            unstaged += xy[1] != "."
+            if rec[0] == "2":
+                i += 1  # renames/copies carry the original path as an extra record
+        elif rec.startswith("u "):
+            conflicts += 1
+        elif rec.startswith("? "):
+            untracked += 1
+    return RepoState(
+        branch=branch,
+        oid=oid,
+        upstream=upstream,
+        ahead=ahead,
+        behind=behind,
+        staged=staged,
+        unstaged=unstaged,
+        untracked=untracked,
+        conflicts=conflicts,
+    )
+
+
+def _changed_paths_v2(out: bytes) -> list[str]:
+    """Every path ``git status --porcelain=v2 -z`` reports (both sides of a rename)."""
+    paths: list[str] = []
+    records = out.decode("utf-8", "surrogateescape").split("\0")
+    i = 0
+    while i < len(records):
+        rec = records[i]
+        i += 1
+        if rec.startswith("1 "):
+            paths.append(rec.split(" ", 8)[8])
+        elif rec.startswith("2 "):
+            paths.append(rec.split(" ", 9)[9])
+            if i < len(records):
+                paths.append(records[i])  # original path
+                i += 1
+        elif rec.startswith("u "):
+            paths.append(rec.split(" ", 10)[10])
+        elif rec.startswith("? "):
+            paths.append(rec[2:])
+    return sorted(set(paths))
+
+
+def _worktree_digest(repo_dir: str, paths: list[str]) -> str:
+    """sha256 over the current on-disk content (or absence) of paths."""
+    h = hashlib.sha256()
+    for rel in paths:
+        full = os.path.join(repo_dir, rel)
+        h.update(rel.encode("utf-8", "surrogateescape") + b"\0")
+        try:
+            st = os.lstat(full)
+        except OSError:
+            h.update(b"-\0")  # deleted
+            continue
+        if stat.S_ISLNK(st.st_mode):
+            h.update(b"l" + os.readlink(full).encode("utf-8", "surrogateescape") + b"\0")
+        elif stat.S_ISREG(st.st_mode):
+            h.update(b"x" if st.st_mode & 0o111 else b"f")
+            with open(full, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+            h.update(b"\0")
+        else:
+            h.update(b"d\0")  # submodule / nested repo: not descended into
+    return h.hexdigest()
+
+
+class RepoMetadataReader:
+    """Reads branch, remote URL and tag facts straight from a repo's git directory.
+
+    HEAD and config are plain files, so reading them avoids a ``git`` process per query. Worktrees
+    whose ``.git`` is a ``gitdir:`` file and linked worktrees (``commondir``) are resolved. Anything
+    the file formats cannot answer reliably -- config ``include``s, URL ``insteadOf`` rewrites,
+    non-branch symbolic refs -- falls back to ``git``. Tags are not read from files: ``last_tag``
+    runs ``git describe`` on every call.
+    """
+
+    _global_rewrites: bool | None = None
+
+    def __init__(self, run_out: Callable[..., tuple[bool, str]]) -> None:
+        self._run_out = run_out
+
+    # ---------- locating the git dir ----------
+    @staticmethod
+    def git_dirs(repo_dir: str) -> tuple[str, str] | None:
+        """Return ``(git_dir, common_dir)`` for a worktree, gitdir-file worktree or bare repo."""
+        dot_git = os.path.join(repo_dir, ".git")
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+        elif os.path.isfile(dot_git):
+            try:
+                with open(dot_git, encoding="utf-8") as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if not line.startswith("gitdir:"):
+                return None
+            git_dir = os.path.normpath(os.path.join(repo_dir, line[len("gitdir:") :].strip()))
+        elif os.path.isfile(os.path.join(repo_dir, "HEAD")) and os.path.isdir(os.path.join(repo_dir, "objects")):
+            git_dir = repo_dir
+        else:
+            return None
+
+        common_dir = git_dir
+        try:
+            with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as f:
+                common_dir = os.path.normpath(os.path.join(git_dir, f.readline().strip()))
+        except OSError:
+            pass
+        return git_dir, common_dir
+
+    # ---------- HEAD ----------
+    def current_branch(self, repo_dir: str) -> str | None:
+        """Short branch name, 'HEAD' when detached (like ``git rev-parse --abbrev-ref HEAD``)."""
+        dirs = self.git_dirs(repo_dir)
+        head = None
+        if dirs:
+            try:
+                with open(os.path.join(dirs[0], "HEAD"), encoding="utf-8") as f:
+                    head = f.readline().strip()
+            except OSError:
+                head = None
+        if head and head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/") :]
+        if head and re.fullmatch(r"[0-9a-f]{40}|[0-9a-f]{64}", head):
+            return "HEAD"
+        ok, out = self._run_out(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_dir)
+        return out.strip() if ok else None
+
+    # ---------- config ----------
+    @classmethod
+    def _has_global_rewrites(cls) -> bool:
+        if cls._global_rewrites is None:
+            home = os.path.expanduser("~")
+            xdg = os.getenv("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+            paths = [os.path.join(home, ".gitconfig"), os.path.join(xdg, "git", "config")]
+            if os.getenv("GIT_CONFIG_GLOBAL"):
+                paths.append(os.environ["GIT_CONFIG_GLOBAL"])
+            # Like git: GIT_CONFIG_NOSYSTEM skips the system file, GIT_CONFIG_SYSTEM points elsewhere.
+            if os.getenv("GIT_CONFIG_NOSYSTEM", "").lower() in ("", "0", "false", "no", "off"):
+                paths.append(os.getenv("GIT_CONFIG_SYSTEM") or "/etc/gitconfig")
+            found = False
+            for p in paths:
+                try:
+                    with open(p, encoding="utf-8", errors="replace") as f:
+                        text = f.read().lower()
+                except OSError:
+                    continue
+                if "insteadof" in text or "[include" in text:
+                    found = True
+                    break
+            cls._global_rewrites = found or bool(os.getenv("GIT_CONFIG_COUNT"))
+        return cls._global_rewrites
+
+    def remote_url(self, repo_dir: str, remote: str = "origin") -> str | None:
+        """Fetch URL of a remote (like ``git remote get-url``)."""
+        url = self._remote_url_from_config(repo_dir, remote)
+        if url is not None:
+            return url
+        ok, out = self._run_out(["git", "remote", "get-url", remote], cwd=repo_dir)
+        return out.strip() if ok else None
+
+    def _remote_url_from_config(self, repo_dir: str, remote: str) -> str | None:
+        dirs = self.git_dirs(repo_dir)
+        if not dirs or self._has_global_rewrites():
+            return None
+        try:
+            with open(os.path.join(dirs[1], "config"), encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        section: tuple[str, str | None] = ("", None)
+        url = None
+        for line in lines:
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            m = _CONFIG_SECTION_RE.match(line)
+            if m:
+                section = (m.group(1).lower(), m.group(2))
+                if section[0] in {"include", "includeif", "url"}:
+                    return None  # includes / insteadOf rewrites: let git resolve them
+                line = line[m.end() :].strip()
+                if not line:
+                    continue
+            if section != ("remote", remote):
+                continue
+            km = _CONFIG_KEY_RE.match(line)
+            if not km or km.group(1).lower() != "url" or km.group(2) is None:
+                continue
+            value = _config_value(km.group(2))
+            if value is None:
+                return None
+            if url is None:
+                url = value  # get-url reports the first url
+        return url
+
+    # ---------- tags ----------
+    def last_tag(self, repo_dir: str) -> str | None:
+        """Nearest tag reachable from HEAD (``git describe --tags --abbrev=0``; one process per call)."""
+        ok, out = self._run_out(["git", "describe", "--tags", "--abbrev=0"], cwd=repo_dir)
+        return out if ok and out else None
 
 
 class GitClient:
+    def __init__(self, *, index_dir: str | None = None, use_index: bool = True) -> None:
+        # Repo discovery goes through a persistent index shared by every command.
+        self.index_dir = index_dir or os.path.join(default_cache_dir(), "index")
+        self.use_index = use_index
+        self.meta = RepoMetadataReader(self._run_out)
+
     # ---------- process helpers ----------
     @staticmethod
     def _run(cmd: list[str], cwd: str | None = None) -> tuple[bool, str | None]:
-        try:
-            subprocess.check_call(cmd, cwd=cwd)
-            return True, None
-        except subprocess.CalledProcessError as e:
-            return False, f"{e}"
+        with trace.subprocess_span(cmd, cwd) as span:
+            try:
+                subprocess.check_call(cmd, cwd=cwd)
+                return True, None
+            except subprocess.CalledProcessError as e:
+                span["exit_code"] = e.returncode
+                return False, f"{e}"
+
+    @staticmethod
+    def _run_remote(cmd: list[str], cwd: str | None = None) -> tuple[bool, str | None]:
+        """Run a git command that talks to a remote; on failure, return git's own error lines.
+
+        stderr is still relayed as it arrives, but its tail is kept, so callers can tell a dropped
+        connection from a missing repository or a refused login.
+        """
+        if "--quiet" not in cmd and sys.stderr.isatty():
+            cmd = cmd + ["--progress"]  # git shows progress only when stderr itself is a terminal
+        with trace.subprocess_span(cmd, cwd) as span:
+            tail: collections.deque[bytes] = collections.deque(maxlen=64)
+            try:
+                proc = subprocess.Popen(cmd, cwd=cwd, stderr=subprocess.PIPE)
+            except OSError as e:
+                return False, f"{e}"
+            with proc:
+                while chunk := proc.stderr.read1(8192):
+                    sys.stderr.buffer.write(chunk)
+                    sys.stderr.buffer.flush()
+                    tail.append(chunk)
+            if proc.returncode == 0:
+                return True, None
+            span["exit_code"] = proc.returncode
+            lines = re.split(r"[\r\n]+", b"".join(tail).decode("utf-8", "replace"))
+            errors = [ln.strip() for ln in lines if ln.startswith(("fatal:", "error:"))]
+            if errors:
+                return False, "; ".join(dict.fromkeys(errors))
+            return False, f"{subprocess.CalledProcessError(proc.returncode, cmd)}"
 
     @staticmethod
     def _run_out(cmd: list[str], cwd: str | None = None) -> tuple[bool, str]:
-        try:
-            out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
-            return True, out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return False, e.output.decode("utf-8", "ignore").strip()
+        with trace.subprocess_span(cmd, cwd) as span:
+            try:
+                out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
+                return True, out.decode("utf-8").strip()
+            except subprocess.CalledProcessError as e:
+                span["exit_code"] = e.returncode
+                return False, e.output.decode("utf-8", "ignore").strip()
+
+    @staticmethod
+    def _run_bytes(cmd: list[str], cwd: str | None = None) -> tuple[bool, bytes]:
+        """Run cmd and return its raw stdout (stderr discarded), for machine-readable output."""
+        with trace.subprocess_span(cmd, cwd):
+            try:
+                return True, subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.DEVNULL)
+            except (subprocess.CalledProcessError, OSError):
+                return False, b""
 
     # ---------- repo discovery & sync ----------
+    def repo_index(self, dest: str, *, max_depth: int | None = None) -> RepoIndex:
+        """Return the persistent repo index for dest (see ``ghca index`` to rebuild it)."""
+        return RepoIndex(dest, self.index_dir, max_depth=max_depth)
+
     def find_worktrees(self, dest: str) -> list[str]:
-        worktrees = set()
-        for root, dirs, _ in os.walk(dest):
-            if ".git" in dirs:
-                worktrees.add(root)
+        with trace.span("find worktrees", "discovery", dest=dest, index=self.use_index) as span:
+            if self.use_index:
+                found = self.repo_index(dest).worktrees()
+            else:
+                worktrees = set()
+                for root, dirs, files in os.walk(dest):
+                    if root == dest and CLONE_STAGING_DIR in dirs:
+                        dirs.remove(CLONE_STAGING_DIR)
+                    # .git is a file in linked worktrees (``clone --mirror-cache worktree``).
+                    if ".git" in dirs or ".git" in files:
+                        worktrees.add(root)
+                        dirs[:] = []
+                found = sorted(d for d in worktrees if not d.endswith(".git"))
+            span["repos"] = len(found)
+        return found
+
+    def find_bare_repos(self, dest: str) -> list[str]:
+        """Bare / mirror repositories under dest."""
+        if self.use_index:
+            return self.repo_index(dest).bare_repos()
+        git_dirs: list[str] = []
+        for root, dirs, _files in os.walk(dest):
+            if root == dest and CLONE_STAGING_DIR in dirs:
+                dirs.remove(CLONE_STAGING_DIR)
+            if root.endswith(".git") and os.path.isfile(os.path.join(root, "config")):
+                git_dirs.append(root)
                 dirs[:] = []
-        return sorted(d for d in worktrees if not d.endswith(".git"))
+        return sorted(git_dirs)
 
     def pull_update(self, dest: str, mirror: bool = False) -> tuple[int, int]:
-        git_dirs: list[str] = []
-        if mirror:
-            for root, dirs, _files in os.walk(dest):
-                if root.endswith(".git") and os.path.isfile(os.path.join(root, "config")):
-                    git_dirs.append(root)
-                    dirs[:] = []
-        else:
-            git_dirs = self.find_worktrees(dest)
+        git_dirs = self.find_bare_repos(dest) if mirror else self.find_worktrees(dest)
 
         ok = 0
         for d in sorted(set(git_dirs)):
-            success, err = self._run(["git", "fetch", "--all", "--prune"], cwd=d)
+            success, err = self.fetch_repo(d)
             ok += 1 if success else 0
             if not success:
                 print(f"[update fail] {d}: {err}", file=sys.stderr)
         return ok, len(git_dirs)
 
+    def fetch_repo(self, repo_dir: str, *, quiet: bool = False) -> tuple[bool, str | None]:
+        """Fetch all remotes (pruning deleted refs) in a worktree or bare/mirror repo."""
+        return self._run(["git", "fetch", "--all", "--prune"] + (["--quiet"] if quiet else []), cwd=repo_dir)
+
     # ---------- clone ----------
+    @staticmethod
+    def clone_target(repo: dict, dest: str, *, mirror: bool = False) -> str:
+        """Local path a repo is cloned to under dest."""
+        return os.path.join(dest, repo["name"] + (".git" if mirror else ""))
+
     def clone_repo(
         self,
         repo: dict,
@@ -66,40 +410,316 @@ class GitClient:
         mirror: bool = False,
         shallow: bool = False,
         token: str | None = None,
+        quiet: bool = False,
+        network_slot: AbstractContextManager | None = None,
+        timings: dict[str, float] | None = None,
+        clone_filter: str = CloneFilter.full.value,
+        sparse: Sequence[str] = (),
+        cache: MirrorCache | None = None,
+        cache_mode: str = CacheMode.reference.value,
     ) -> tuple[bool, str | None]:
-        name = repo["name"]
-        url = repo["ssh_url"] if use_ssh else repo["clone_url"]
-        if (not use_ssh) and token:
-            url = GitHubClient.inject_token_into_https(url, token)
+        """Clone one repo into dest.
+
+        When ``network_slot`` is given, only the transfer from the remote runs while the slot is held;
+        the working tree checkout happens afterwards so local disk work does not pin a connection.
+        If ``timings`` is given it receives the seconds spent per stage (``wait``, ``clone``, ``checkout``).
+
+        ``clone_filter`` makes a blobless or treeless partial clone; later fetches keep the filter (git
+        records it in the repo's config). ``sparse`` limits the working tree to those directories
+        (cone-mode sparse checkout); it is ignored for mirrors, which have no working tree.
 
-        target = os.path.join(dest, name + (".git" if mirror else ""))
+        With ``cache``, the repo's mirror in the cache is refreshed (the only network transfer) and the
+        checkout is made from it according to ``cache_mode`` (see ``_clone_from_cache``); ``mirror``,
+        ``shallow`` and ``clone_filter`` do not apply. Checkouts that borrow from the mirror are recorded
+        on it, so it is not evicted while they need it.
+
+        The clone is built under ``<dest>/.ghca-partial`` and renamed to its target only once complete,
+        so a failed or killed clone never leaves a half-written target; the next attempt starts by
+        discarding what it left there. An existing target is never touched.
+        """
+        stages = timings if timings is not None else {}
+        url = self._remote_url(repo, use_ssh=use_ssh, token=token)
+
+        target = self.clone_target(repo, dest, mirror=mirror)
         if os.path.exists(target):
-            return True, f"skip (exists): {name}"
+            return True, f"skip (exists): {repo['name']}"
+        work = os.path.join(dest, CLONE_STAGING_DIR, os.path.basename(target))
+        shutil.rmtree(work, ignore_errors=True)
+        if cache is not None and not mirror:
+            ok, err = self._clone_from_cache(
+                repo,
+                work,
+                url,
+                cache,
+                cache_mode,
+                quiet=quiet,
+                network_slot=network_slot,
+                stages=stages,
+                sparse=sparse,
+            )
+        else:
+            ok, err = self._clone_from_remote(
+                work,
+                url,
+                mirror=mirror,
+                shallow=shallow,
+                quiet=quiet,
+                network_slot=network_slot,
+                stages=stages,
+                clone_filter=clone_filter,
+                sparse=sparse,
+            )
+        if ok:
+            ok, err = self._move_clone(work, target)
+        if not ok:
+            shutil.rmtree(work, ignore_errors=True)
+        elif cache is not None and not mirror and cache_mode != CacheMode.dissociate.value:
+            cache.add_referrer(cache.path(repo), target)
+        return ok, err
+
+    def _move_clone(self, work: str, target: str) -> tuple[bool, str | None]:
+        try:
+            # rename() refuses a non-empty target, so a directory that appeared meanwhile is kept.
+            os.rename(work, target)
+        except OSError as e:
+            return False, f"cannot move the finished clone into place: {e}"
+        if os.path.isfile(os.path.join(target, ".git")):
+            # A linked worktree: point the mirror's record of it at the new location.
+            return self._run(["git", "worktree", "repair"], cwd=target)
+        return True, None
 
+    def _clone_from_remote(
+        self,
+        target: str,
+        url: str,
+        *,
+        mirror: bool,
+        shallow: bool,
+        quiet: bool,
+        network_slot: AbstractContextManager | None,
+        stages: dict[str, float],
+        clone_filter: str,
+        sparse: Sequence[str],
+    ) -> tuple[bool, str | None]:
         cmd = ["git", "-c", "credential.helper=", "clone"]
+        if quiet:
+            cmd.append("--quiet")
         if mirror:
             cmd.append("--mirror")
         elif shallow:
             cmd += ["--depth", "1", "--single-branch"]
-        cmd += [url, target]
-        return self._run(cmd)
+        if clone_filter != CloneFilter.full.value:
+            cmd.append(f"--filter={_FILTER_SPECS[clone_filter]}")
+        sparse = () if mirror else sparse
+        if network_slot is None and not sparse:
+            t0 = time.perf_counter()
+            result = self._run_remote(cmd + [url, target])
+            stages["clone"] = time.perf_counter() - t0
+            return result
+
+        split_checkout = not mirror
+        if split_checkout:
+            cmd.append("--no-checkout")
+        # A partial clone downloads the missing objects during checkout, so that step needs the slot too.
+        checkout_in_slot = split_checkout and clone_filter != CloneFilter.full.value
+        t0 = time.perf_counter()
+        with trace.acquire("network slot", network_slot) if network_slot is not None else nullcontext():
+            t1 = time.perf_counter()
+            ok, err = self._run_remote(cmd + [url, target])
+            t2 = time.perf_counter()
+            if ok and checkout_in_slot:
+                ok, err = self._checkout_head(target, quiet=quiet, sparse=sparse)
+        if network_slot is not None:
+            stages["wait"] = t1 - t0
+        stages["clone"] = t2 - t1
+        if ok and split_checkout and not checkout_in_slot:
+            ok, err = self._checkout_head(target, quiet=quiet, sparse=sparse)
+        if split_checkout:
+            stages["checkout"] = time.perf_counter() - t2
+        return ok, err
+
+    @staticmethod
+    def _remote_url(repo: dict, *, use_ssh: bool, token: str | None) -> str:
+        url = repo["ssh_url"] if use_ssh else repo["clone_url"]
+        if (not use_ssh) and token:
+            url = GitHubClient.inject_token_into_https(url, token)
+        return url
+
+    def refresh_mirror(
+        self, cache: MirrorCache, repo: dict, url: str, *, quiet: bool = False
+    ) -> tuple[bool, str | None]:
+        """Create repo's mirror in cache, or fetch only what changed since the last refresh.
+
+        Branches and tags are fetched from url by explicit refspec (so tokens never land in the mirror's
+        config, and pull-request refs are left out); the plain remote URL is recorded as ``origin``.
+        """
+        path = cache.path(repo)
+        fetch = ["git", "-c", "credential.helper=", "fetch", "--prune"] + (["--quiet"] if quiet else [])
+        fetch += [url, "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+        if os.path.isdir(path):
+            # Checkouts made with `worktree add` and since deleted would otherwise pin their branches.
+            self._run(["git", "worktree", "prune"], cwd=path)
+            result = self._run_remote(fetch, cwd=path)
+            cache.touch(path)
+            return result
+        origin = repo["ssh_url"] if url == repo.get("ssh_url") else repo["clone_url"]
+        staged = cache.staging()
+        steps = [
+            (["git", "init", "--bare", "--quiet", staged], None),
+            (fetch, staged),
+            (["git", "remote", "add", "origin", origin], staged),
+        ]
+        if repo.get("default_branch"):
+            steps.append((["git", "symbolic-ref", "HEAD", f"refs/heads/{repo['default_branch']}"], staged))
+        for cmd, cwd in steps:
+            ok, err = (self._run_remote if cmd is fetch else self._run)(cmd, cwd=cwd)
+            if not ok:
+                shutil.rmtree(staged, ignore_errors=True)
+                return ok, err
+        cache.install(staged, path)
+        return True, None
+
+    def _clone_from_cache(
+        self,
+        repo: dict,
+        target: str,
+        url: str,
+        cache: MirrorCache,
+        mode: str,
+        *,
+        quiet: bool,
+        network_slot: AbstractContextManager | None,
+        stages: dict[str, float],
+        sparse: Sequence[str],
+    ) -> tuple[bool, str | None]:
+        """Refresh the mirror, then make target from it without touching the network.
+
+        ``reference`` clones borrow the mirror's objects through alternates, ``dissociate`` copies them
+        so the checkout stands alone, and ``worktree`` adds a detached linked worktree of the mirror
+        itself (cheapest; meant for read-only jobs).
+        """
+        t0 = time.perf_counter()
+        with trace.acquire("network slot", network_slot) if network_slot is not None else nullcontext():
+            t1 = time.perf_counter()
+            ok, err = self.refresh_mirror(cache, repo, url, quiet=quiet)
+        t2 = time.perf_counter()
+        if network_slot is not None:
+            stages["wait"] = t1 - t0
+        stages["fetch"] = t2 - t1
+        if not ok:
+            return ok, err
+
+        path = cache.path(repo)
+        branch = repo.get("default_branch")
+        has_branch = (
+            bool(branch)
+            and self._run_out(["git", "rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"], cwd=path)[0]
+        )
+        if mode == CacheMode.worktree.value and has_branch:
+            # Detached, so the next refresh can still move the branch in the mirror while this checkout lives.
+            ok, err = self._run(["git", "worktree", "add", "--detach", "--no-checkout", target, branch], cwd=path)
+        else:
+            cmd = ["git", "clone", "--no-checkout", "--reference", path]
+            if mode == CacheMode.dissociate.value:
+                cmd.append("--dissociate")
+            # A file:// source makes git negotiate against the alternates, so no objects are copied.
+            ok, err = self._run(cmd + (["--quiet"] if quiet else []) + ["file://" + os.path.abspath(path), target])
+            if ok:
+                ok, err = self._run(["git", "remote", "set-url", "origin", url], cwd=target)
+        t3 = time.perf_counter()
+        stages["clone"] = t3 - t2
+        if ok:
+            ok, err = self._checkout_head(target, quiet=quiet, sparse=sparse)
+        stages["checkout"] = time.perf_counter() - t3
+        return ok, err
+
+    def _checkout_head(
+        self, repo_dir: str, *, quiet: bool = False, sparse: Sequence[str] = ()
+    ) -> tuple[bool, str | None]:
+        if sparse:
+            ok, err = self._run(["git", "sparse-checkout", "set", "--cone", "--", *sparse], cwd=repo_dir)
+            if not ok:
+                return ok, err
+        # Empty repositories have no HEAD commit to check out.
+        has_head, _ = self._run_out(["git", "rev-parse", "--verify", "--quiet", "HEAD"], cwd=repo_dir)
+        if not has_head:
+            return True, None
+        return self._run(["git", "checkout"] + (["--quiet"] if quiet else []), cwd=repo_dir)
 
     # ---------- per-repo ops ----------
+    def probe(self, repo_dir: str) -> RepoState | None:
+        """Branch, upstream, ahead/behind and change counts from a single ``git status`` call."""
+        ok, out = self._run_bytes(["git", "status", "--porcelain=v2", "--branch", "-z"], cwd=repo_dir)
+        return _parse_status_v2(out) if ok else None
+
+    def probe_many(self, repo_dirs: Sequence[str], jobs: int = PROBE_CONCURRENCY) -> list[RepoState | None]:
+        """Probe several repos in parallel; results are in input order."""
+
+        def _one(repo_dir: str) -> RepoState | None:
+            with trace.repo(os.path.basename(repo_dir.rstrip(os.sep)), "probe"):
+                return self.probe(repo_dir)
+
+        if jobs <= 1 or len(repo_dirs) <= 1:
+            return [_one(d) for d in repo_dirs]
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(_one, repo_dirs))
+
+    def tree_state(self, repo_dir: str) -> str | None:
+        """Identify the exact content of a worktree: HEAD's tree plus a digest of uncommitted changes.
+
+        The digest covers every path ``git status`` reports (staged, unstaged and untracked files,
+        ignored ones excluded), hashed from disk, so two calls agree exactly when nothing tracked or
+        untracked has changed. Returns None outside a git worktree.
+
+        repo_dir may be a subdirectory of the worktree: the digest still covers the whole worktree
+        (status paths are relative to its top level), and the state starts with repo_dir's path
+        inside it, so two folders of one repo never share a state.
+        """
+        ok, out = self._run_bytes(["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"], cwd=repo_dir)
+        if not ok:
+            return None
+        location = ["git", "rev-parse", "--show-toplevel", "--show-prefix"]
+        ok, where = self._run_bytes(location + ["HEAD^{tree}"], cwd=repo_dir)
+        if not ok:  # unborn HEAD
+            ok, where = self._run_bytes(location, cwd=repo_dir)
+            if not ok:
+                return None
+        top, prefix, *tree = where.decode("utf-8", "surrogateescape").split("\n")
+        head = tree[0] if tree and tree[0] else "unborn"
+        state = f"{prefix}:{head}" if prefix else head
+        paths = _changed_paths_v2(out)
+        return f"{state}+{_worktree_digest(top, paths)}" if paths else state
+
+    def received_pack_bytes(self, repo_dir: str) -> int | None:
+        """Size of the packs in a fresh clone's own object store, i.e. the object data it received.
+
+        A clone keeps what it fetched as pack files, so this is one directory listing rather than a
+        walk of the checkout. A linked worktree shares another repo's objects and counts as 0.
+        """
+        dirs = RepoMetadataReader.git_dirs(repo_dir)
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+        if git_dir != common_dir:
+            return 0
+        try:
+            with os.scandir(os.path.join(common_dir, "objects", "pack")) as entries:
+                return sum(e.stat().st_size for e in entries if e.name.endswith(".pack"))
+        except OSError:
+            return 0
+
     def status_has_changes(self, repo_dir: str) -> bool:
-        ok, out = self._run_out(["git", "status", "--porcelain"], cwd=repo_dir)
-        return bool(ok and out.strip())
+        state = self.probe(repo_dir)
+        return bool(state and state.dirty)
 
     def current_branch(self, repo_dir: str) -> str | None:
-        ok, out = self._run_out(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_dir)
-        return out.strip() if ok else None
+        return self.meta.current_branch(repo_dir)
 
     def origin_url(self, repo_dir: str) -> str | None:
-        ok, out = self._run_out(["git", "remote", "get-url", "origin"], cwd=repo_dir)
-        return out.strip() if ok else None
+        return self.meta.remote_url(repo_dir, "origin")
 
     def last_tag(self, repo_dir: str) -> str | None:
-        ok, out = self._run_out(["git", "describe", "--tags", "--abbrev=0"], cwd=repo_dir)
-        return out if ok and out else None
+        return self.meta.last_tag(repo_dir)
 
     def commits_since(self, repo_dir: str, ref: str) -> int:
         ok, out = self._run_out(["git", "rev-list", "--count", f"{ref}..HEAD"], cwd=repo_dir)
@@ -118,43 +738,61 @@ class GitClient:
         return None
 
     # ---------- commit & push ----------
-    def commit_and_push_one(
+    def commit_one(
         self,
         repo_dir: str,
         *,
         message: str,
-        branch: str | None,
         allow_empty: bool,
         sign: bool,
-        token: str | None,
-        push_no_verify: bool,
+        state: RepoState | None = None,
+        quiet: bool = False,
     ) -> tuple[bool, str]:
+        """Local stage: stage everything and commit. Returns a ``[committed]``/``[clean]``/``[fail]`` message."""
         name = os.path.basename(repo_dir.rstrip(os.sep))
         if not os.path.isdir(os.path.join(repo_dir, ".git")):
             return False, f"[skip] {name}: not a git worktree"
 
+        # Check before staging: a clean repo needs no `git add` at all.
+        state = state or self.probe(repo_dir)
+        if not (state and state.dirty) and not allow_empty:
+            return True, f"[clean] {name}: no changes"
+
         ok, err = self._run(["git", "add", "-A"], cwd=repo_dir)
         if not ok:
             return False, f"[fail] {name}: git add failed: {err}"
 
-        if not self.status_has_changes(repo_dir) and not allow_empty:
-            return True, f"[clean] {name}: no changes"
-
         commit_cmd = ["git", "commit", "-m", message]
         if allow_empty:
             commit_cmd.append("--allow-empty")
         if sign:
             commit_cmd.append("-S")
+        if quiet:
+            commit_cmd.append("--quiet")
         ok, err = self._run(commit_cmd, cwd=repo_dir)
         if not ok and (not err or "nothing to commit" not in err.lower()):
             return False, f"[fail] {name}: git commit failed: {err}"
+        return True, f"[committed] {name}"
 
+    def push_one(
+        self,
+        repo_dir: str,
+        *,
+        branch: str | None,
+        token: str | None,
+        push_no_verify: bool,
+        quiet: bool = False,
+    ) -> tuple[bool, str]:
+        """Network stage: push HEAD to the target branch. Returns a ``[pushed]``/``[fail]`` message."""
+        name = os.path.basename(repo_dir.rstrip(os.sep))
         target_branch = branch or self.current_branch(repo_dir) or "main"
         origin_url = self.origin_url(repo_dir)
 
         push_cmd = ["git", "push"]
         if push_no_verify:
             push_cmd.append("--no-verify")
+        if quiet:
+            push_cmd.append("--quiet")
 
         push_url = None
         if origin_url and origin_url.startswith("https://") and token:
@@ -170,3 +808,20 @@ class GitClient:
         if ok:
             return True, f"[pushed] {name} -> {target_branch}"
         return False, f"[fail] {name}: git push failed: {err}"
+
+    def commit_and_push_one(
+        self,
+        repo_dir: str,
+        *,
+        message: str,
+        branch: str | None,
+        allow_empty: bool,
+        sign: bool,
+        token: str | None,
+        push_no_verify: bool,
+        state: RepoState | None = None,
+    ) -> tuple[bool, str]:
+        ok, msg = self.commit_one(repo_dir, message=message, allow_empty=allow_empty, sign=sign, state=state)
+        if not ok or msg.startswith("[clean]"):
+            return ok, msg
+        return self.push_one(repo_dir, branch=branch, token=token, push_no_verify=push_no_verify)
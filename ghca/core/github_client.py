@@ -2,35 +2,137 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mimetypes
 import os
 import shutil
 import subprocess
-import urllib.request
-from collections.abc import Sequence
-from typing import Any
-from urllib.parse import urlparse, urlunparse
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, TextIO
+from urllib.parse import parse_qs, quote, urlparse, urlunparse
 
-from .constants import API_BASE, GITHUB_API_ACCEPT, HTTP_TIMEOUT_SEC, USER_AGENT
+from . import trace
+from .constants import API_BASE, ASSET_UPLOAD_CONCURRENCY, GITHUB_API_ACCEPT, PAGE_FETCH_CONCURRENCY, USER_AGENT
+from .http import HttpResponse, HttpTransport, default_transport, parse_link_header
+from .http_cache import ResponseCache
+from .ratelimit import RateLimitScheduler, default_scheduler
 
 
 class GitHubError(RuntimeError):
     pass
 
 
+class GitHubHTTPError(GitHubError):
+    """An API call answered with a non-success status."""
+
+    def __init__(self, method: str, url: str, resp: HttpResponse) -> None:
+        try:
+            detail = (resp.json() or {}).get("message", "")
+        except (ValueError, AttributeError):
+            detail = resp.body[:200].decode("utf-8", "replace")
+        super().__init__(f"{method} {url} -> HTTP {resp.status}{': ' + detail if detail else ''}")
+        self.status = resp.status
+        self.response = resp
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Hex sha256 of a file, read in chunks so large assets never sit in memory."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _page_number(url: str | None) -> int | None:
+    if not url:
+        return None
+    values = parse_qs(urlparse(url).query).get("page")
+    return int(values[0]) if values and values[0].isdigit() else None
+
+
 class GitHubClient:
-    def __init__(self, token: str | None = None) -> None:
+    def __init__(
+        self,
+        token: str | None = None,
+        *,
+        api_base: str = API_BASE,
+        transport: HttpTransport | None = None,
+        page_concurrency: int = PAGE_FETCH_CONCURRENCY,
+        cache: ResponseCache | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        asset_concurrency: int = ASSET_UPLOAD_CONCURRENCY,
+    ) -> None:
         self.token = token
+        self.api_base = api_base.rstrip("/")
+        self.transport = transport or default_transport()
+        self.page_concurrency = page_concurrency
+        self.cache = cache
+        self.scheduler = scheduler or default_scheduler()
+        self.asset_concurrency = asset_concurrency
 
     # ---------- low-level HTTP ----------
-    def _request_json(self, url: str) -> Any:
-        req = urllib.request.Request(url)
-        req.add_header("Accept", GITHUB_API_ACCEPT)
-        req.add_header("User-Agent", USER_AGENT)
+    def _headers(self) -> dict[str, str]:
+        headers = {"Accept": GITHUB_API_ACCEPT, "User-Agent": USER_AGENT}
         if self.token:
-            req.add_header("Authorization", f"Bearer {self.token}")
-        with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SEC) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | BinaryIO | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        hdrs = {**self._headers(), **(headers or {})}
+        cache_key = cached = None
+        if self.cache is not None and method == "GET":
+            cache_key = self.cache.key(url, self.token)
+            cached = self.cache.load(cache_key)
+            if cached is not None:
+                hdrs.update(self.cache.validators(cached))
+
+        resp = self._send_scheduled(method, url, hdrs, body)
+        if resp.status == 304 and cached is not None:
+            # Not modified: serve locally (304s are not charged against the rate limit).
+            self.cache.touch(cache_key)
+            return cached
+        if resp.status >= 400:
+            raise GitHubHTTPError(method, url, resp)
+        if cache_key is not None and resp.status == 200:
+            self.cache.store(cache_key, resp)
+        return resp
+
+    def _send_scheduled(
+        self, method: str, url: str, headers: dict[str, str], body: bytes | BinaryIO | None
+    ) -> HttpResponse:
+        start = body.tell() if body is not None and hasattr(body, "seek") else 0
+        attempt = 0
+        while True:
+            with (
+                trace.acquire("rate limit", self.scheduler.slot()),
+                trace.span(f"{method} {urlparse(url).path}", "http", url=url, attempt=attempt) as span,
+            ):
+                resp = self.transport.request(method, url, headers=headers, body=body)
+                span.update(status=resp.status, bytes=len(resp.body))
+            self.scheduler.observe(resp)
+            if self.scheduler.retry_delay(resp, attempt) is None:
+                return resp
+            # The scheduler has paused new requests; the next slot() waits it out.
+            attempt += 1
+            if body is not None and hasattr(body, "seek"):
+                body.seek(start)
+
+    def _request_json(self, url: str) -> Any:
+        return self._request("GET", url).json()
+
+    def _send_json(self, method: str, url: str, payload: Any) -> Any:
+        body = json.dumps(payload).encode("utf-8")
+        return self._request(method, url, body=body, headers={"Content-Type": "application/json"}).json()
 
     # ---------- public API ----------
     @staticmethod
@@ -46,22 +148,179 @@ class GitHubClient:
         include_archived: bool = False,
         visibility: str = "all",
     ) -> list[dict[str, Any]]:
-        repos: list[dict[str, Any]] = []
-        page, per_page = 1, 100
-        while True:
-            url = (
-                f"{API_BASE}/orgs/{org}/repos"
-                f"?per_page={per_page}&page={page}&type=all&sort=full_name&direction=asc&visibility={visibility}"
+        """List org repos ordered by ``full_name`` (see ``iter_org_repos``)."""
+        return list(self.iter_org_repos(org, include_archived=include_archived, visibility=visibility))
+
+    def iter_org_repos(
+        self,
+        org: str,
+        include_archived: bool = False,
+        visibility: str = "all",
+    ) -> Iterator[dict[str, Any]]:
+        """Yield org repos ordered by ``full_name`` as soon as each page arrives.
+
+        The first page's ``Link: rel="last"`` tells how many pages exist; the rest are then fetched
+        concurrently (bounded by ``page_concurrency``) and yielded in page order.
+        """
+        per_page = 100
+        base = (
+            f"{self.api_base}/orgs/{org}/repos"
+            f"?per_page={per_page}&type=all&sort=full_name&direction=asc&visibility={visibility}"
+        )
+
+        def _keep(page: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+            return (r for r in page if include_archived or not r.get("archived"))
+
+        first = self._request("GET", f"{base}&page=1")
+        yield from _keep(first.json() or [])
+        links = parse_link_header(first.header("link"))
+        last = _page_number(links.get("last"))
+        if last and last > 1:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.page_concurrency, last - 1))) as pool:
+                for page in pool.map(lambda p: self._request_json(f"{base}&page={p}") or [], range(2, last + 1)):
+                    yield from _keep(page)
+            return
+
+        # No rel="last" advertised: follow rel="next" one page at a time.
+        next_url = links.get("next")
+        while next_url:
+            resp = self._request("GET", next_url)
+            yield from _keep(resp.json() or [])
+            next_url = parse_link_header(resp.header("link")).get("next")
+
+    # ---------- REST release backend ----------
+    def create_release(
+        self,
+        *,
+        repo_full: str,  # "owner/name"
+        tag: str,
+        title: str | None = None,
+        notes_file: str | None = None,
+        generate_notes: bool = False,
+        draft: bool = False,
+        prerelease: bool = False,
+        target: str | None = None,
+        asset_paths: Sequence[str] = (),
+        cwd: str | None = None,
+        dry_run: bool = False,
+        resume: bool = False,
+        stats: dict[str, int] | None = None,
+    ) -> tuple[bool, str]:
+        """Create a GitHub release through the REST API (same contract as ``create_release_with_gh``).
+
+        With assets, the release is created as a draft and published once every asset is uploaded, so
+        a run that fails halfway leaves a draft that the next run picks up. A published release with
+        the tag is left alone unless ``resume`` is set, and then only missing assets are added to it.
+        If ``stats`` is given it receives ``uploaded_bytes``, the size of the assets actually uploaded.
+        """
+        payload: dict[str, Any] = {"tag_name": tag, "name": title or tag, "draft": draft, "prerelease": prerelease}
+        if target:
+            payload["target_commitish"] = target
+        if notes_file:
+            path = notes_file if os.path.isabs(notes_file) or not cwd else os.path.join(cwd, notes_file)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    payload["body"] = f.read()
+            except OSError as e:
+                return False, f"cannot read notes file: {e}"
+        elif generate_notes:
+            payload["generate_release_notes"] = True
+
+        url = f"{self.api_base}/repos/{repo_full}/releases"
+        if dry_run:
+            assets = "".join(f" asset={os.path.basename(a)}" for a in asset_paths)
+            return True, f"[dry-run] POST {url} tag={tag} title={payload['name']!r}{assets}"
+
+        status = "released"
+        try:
+            release = self._find_draft(url, tag) if (draft or asset_paths) else None
+            if release is not None:
+                status = "resumed"
+            else:
+                try:
+                    release = self._send_json("POST", url, {**payload, "draft": draft or bool(asset_paths)})
+                except GitHubHTTPError as e:
+                    if e.status != 422 or b"already_exists" not in e.response.body:
+                        raise
+                    if not resume:
+                        return False, f"release {tag} already exists (--resume adds missing assets to it)"
+                    release = self._request_json(f"{url}/tags/{quote(tag, safe='')}")
+                    status = "exists"
+            # Assets of a published release are only ever added, never replaced.
+            uploaded, unchanged, uploaded_bytes = self.upload_release_assets(
+                release, asset_paths, repo_full=repo_full, replace=bool(release.get("draft"))
             )
-            data = self._request_json(url)
-            if not data:
-                break
-            for r in data:
-                if (not include_archived) and r.get("archived"):
-                    continue
-                repos.append(r)
-            page += 1
-        return repos
+            if stats is not None:
+                stats["uploaded_bytes"] = uploaded_bytes
+            if release.get("draft") and not draft:
+                self._send_json("PATCH", release.get("url") or f"{url}/{release['id']}", {"draft": False})
+        except (GitHubError, OSError) as e:
+            return False, f"API failed: {e}"
+
+        msg = f"[{status}] {repo_full} tag={tag}"
+        if asset_paths:
+            msg += f" (assets: uploaded={uploaded}, unchanged={unchanged})"
+        return True, msg
+
+    def _find_draft(self, releases_url: str, tag: str) -> dict[str, Any] | None:
+        """Return the draft release for tag, if any (``/releases/tags/{tag}`` never returns drafts).
+
+        Only the newest page is searched: a draft left by an earlier run is among the latest releases.
+        """
+        releases = self._request_json(f"{releases_url}?per_page=100") or []
+        return next((r for r in releases if r.get("draft") and r.get("tag_name") == tag), None)
+
+    def upload_release_assets(
+        self,
+        release: dict[str, Any],
+        paths: Sequence[str],
+        *,
+        repo_full: str,
+        jobs: int | None = None,
+        replace: bool = True,
+    ) -> tuple[int, int, int]:
+        """Upload files to a release in parallel, skipping ones already there with the same content.
+
+        Each file is hashed (sha256, streamed in chunks) and compared with the ``digest`` GitHub reports
+        for an existing asset of the same name: a match is skipped, a mismatch is replaced (or, without
+        ``replace``, is an error). Returns ``(uploaded, unchanged, uploaded bytes)``.
+        """
+        if not paths:
+            return 0, 0, 0
+        current = {a["name"]: a for a in release.get("assets") or []}
+
+        def _one(path: str) -> int | None:
+            """Upload path unless an identical asset is there; return the bytes sent (None when skipped)."""
+            name = os.path.basename(path)
+            asset = current.get(name)
+            if asset is not None:
+                if asset.get("digest") == f"sha256:{file_sha256(path)}":
+                    return None
+                if not replace:
+                    raise GitHubError(f"{name} differs from the published asset; refusing to replace it")
+                self._request(
+                    "DELETE", asset.get("url") or f"{self.api_base}/repos/{repo_full}/releases/assets/{asset['id']}"
+                )
+            self.upload_release_asset(release, path)
+            return os.path.getsize(path)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs or self.asset_concurrency, len(paths)))) as pool:
+            sent = [n for n in pool.map(trace.in_repo(_one), paths) if n is not None]
+        return len(sent), len(paths) - len(sent), sum(sent)
+
+    def upload_release_asset(self, release: dict[str, Any], path: str) -> dict[str, Any]:
+        """Upload one file to a release, streaming it from disk."""
+        upload_url = release["upload_url"].split("{", 1)[0]
+        name = os.path.basename(path)
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        with open(path, "rb") as f:
+            resp = self._request(
+                "POST",
+                f"{upload_url}?name={quote(name)}",
+                body=f,
+                headers={"Content-Type": content_type, "Content-Length": str(os.fstat(f.fileno()).st_size)},
+            )
+        return resp.json()
 
     # ---------- gh release backend ----------
     @staticmethod
@@ -69,6 +328,24 @@ class GitHubClient:
         if not shutil.which("gh"):
             raise GitHubError("GitHub CLI 'gh' not found. Install https://cli.github.com/ and run 'gh auth login'.")
 
+    @staticmethod
+    def token_from_gh(api_base: str = API_BASE) -> str | None:
+        """Return the token ``gh auth login`` stored for api_base's host; None without gh or a login."""
+        if not shutil.which("gh"):
+            return None
+        host = urlparse(api_base).hostname or "github.com"
+        host = "github.com" if host == "api.github.com" else host
+        cmd = ["gh", "auth", "token", "--hostname", host]
+        with trace.subprocess_span(cmd) as span:
+            try:
+                out = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+            span["exit_code"] = out.returncode
+        if out.returncode != 0:
+            return None
+        return out.stdout.strip() or None
+
     def create_release_with_gh(
         self,
         *,
@@ -83,8 +360,13 @@ class GitHubClient:
         asset_paths: Sequence[str] = (),
         cwd: str | None = None,
         dry_run: bool = False,
+        stdout: TextIO | None = None,
+        stats: dict[str, int] | None = None,
     ) -> tuple[bool, str]:
-        """Create a GitHub release via the gh CLI. Returns (ok, message)."""
+        """Create a GitHub release via the gh CLI. Returns (ok, message); gh's own output goes to stdout.
+
+        If ``stats`` is given it receives ``uploaded_bytes`` (gh uploads every asset).
+        """
         self._ensure_gh_available()
 
         cmd = ["gh", "release", "create", tag, "-R", repo_full, "--title", (title or tag)]
@@ -110,7 +392,14 @@ class GitHubClient:
             return True, f"[dry-run] {' '.join(cmd)}"
 
         try:
-            subprocess.check_call(cmd, cwd=cwd, env=env)
+            with trace.subprocess_span(cmd, cwd) as span:
+                try:
+                    subprocess.check_call(cmd, cwd=cwd, env=env, stdout=stdout)
+                except subprocess.CalledProcessError as e:
+                    span["exit_code"] = e.returncode
+                    raise
+            if stats is not None:
+                stats["uploaded_bytes"] = sum(os.path.getsize(a) for a in asset_paths)
             return True, f"[released] {repo_full} tag={tag}"
         except subprocess.CalledProcessError as e:
             return False, f"gh failed: {e}"
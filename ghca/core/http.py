@@ -0,0 +1,202 @@
+"""Pooled keep-alive HTTP transport shared by every API client in the process."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import http.client
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from .constants import HTTP_TIMEOUT_SEC
+
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+# Errors that mean a pooled connection was closed by the server while idle.
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+_LINK_RE = re.compile(r'<(?P<url>[^>]*)>\s*;.*?\brel="?(?P<rel>[^";]+)"?')
+
+# scheme, host, port, proxy URL ("" for a direct connection)
+_ConnKey = tuple[str, str, int, str]
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """A fully read HTTP response (headers are lower-cased)."""
+
+    status: int
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def header(self, name: str) -> str | None:
+        """Return a response header value, case-insensitively."""
+        return self.headers.get(name.lower())
+
+    def json(self) -> Any:
+        """Decode the body as JSON (``None`` for an empty body)."""
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+
+class HttpTransport:
+    """Thread-safe pool of persistent ``http.client`` connections keyed by scheme/host/port/proxy.
+
+    Each request borrows an idle connection for its host (or opens one), reads the whole
+    response and hands the connection back, so consecutive requests skip the TCP/TLS handshake.
+    Proxies come from the environment like urllib's (``HTTPS_PROXY``/``HTTP_PROXY``/``NO_PROXY``):
+    HTTPS is tunnelled with ``CONNECT``, plain HTTP is sent to the proxy in absolute form.
+    """
+
+    def __init__(self, *, timeout: float = HTTP_TIMEOUT_SEC, max_idle_per_host: int = 16) -> None:
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[_ConnKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    # ---------- pool ----------
+    @staticmethod
+    def _key(url: str) -> _ConnKey:
+        u = urlsplit(url)
+        scheme = u.scheme.lower()
+        if scheme not in {"http", "https"}:
+            raise ValueError(f"unsupported URL scheme: {url!r}")
+        host = u.hostname or ""
+        proxy = "" if proxy_bypass(host) else getproxies().get(scheme, "")
+        if proxy and "://" not in proxy:
+            proxy = "http://" + proxy
+        return scheme, host, u.port or (443 if scheme == "https" else 80), proxy
+
+    @staticmethod
+    def _proxy_headers(proxy: str) -> dict[str, str]:
+        p = urlsplit(proxy)
+        if p.username is None:
+            return {}
+        creds = f"{unquote(p.username)}:{unquote(p.password or '')}".encode()
+        return {"Proxy-Authorization": "Basic " + base64.b64encode(creds).decode("ascii")}
+
+    def _acquire(self, key: _ConnKey) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port, proxy = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        if not proxy:
+            return cls(host, port, timeout=self.timeout, blocksize=64 * 1024), False
+        p = urlsplit(proxy)
+        conn = cls(p.hostname or "", p.port or 80, timeout=self.timeout, blocksize=64 * 1024)
+        if scheme == "https":
+            conn.set_tunnel(host, port, headers=self._proxy_headers(proxy))
+        return conn, False
+
+    def _release(self, key: _ConnKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for conns in pools.values():
+            for c in conns:
+                c.close()
+
+    # ---------- requests ----------
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | BinaryIO | None = None,
+        max_redirects: int = 5,
+    ) -> HttpResponse:
+        """Send a request and return the decoded response; redirects are followed.
+
+        ``body`` may be bytes or a seekable binary file, which is streamed rather than read into memory.
+        """
+        hdrs = {"Accept-Encoding": "gzip", **(headers or {})}
+        for _ in range(max_redirects + 1):
+            resp = self._send(method, url, hdrs, body)
+            location = resp.header("location")
+            if resp.status not in _REDIRECT_CODES or not location:
+                return resp
+            target = urljoin(url, location)
+            if self._key(target)[:2] != self._key(url)[:2]:
+                # Never forward credentials to another host.
+                hdrs = {k: v for k, v in hdrs.items() if k.lower() != "authorization"}
+            if resp.status == 303 or (resp.status in {301, 302} and method == "POST"):
+                method, body = "GET", None
+            url = target
+        raise http.client.HTTPException(f"too many redirects for {url}")
+
+    def _send(self, method: str, url: str, headers: dict[str, str], body: bytes | BinaryIO | None) -> HttpResponse:
+        key = self._key(url)
+        u = urlsplit(url)
+        path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+        if key[3] and key[0] == "http":
+            # Plain HTTP through a proxy: absolute-form request line, credentials on every request.
+            path = u._replace(fragment="").geturl()
+            headers = {**headers, **self._proxy_headers(key[3])}
+        start = body.tell() if body is not None and hasattr(body, "seek") else 0
+
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                raw = conn.getresponse()
+                data = raw.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle connection; rewind and retry on a fresh one.
+                if body is not None and hasattr(body, "seek"):
+                    body.seek(start)
+                continue
+            except BaseException:
+                conn.close()
+                raise
+
+            if raw.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+
+            resp_headers = {k.lower(): v for k, v in raw.getheaders()}
+            if resp_headers.get("content-encoding", "").lower() == "gzip" and data:
+                data = gzip.decompress(data)
+            return HttpResponse(status=raw.status, url=url, headers=resp_headers, body=data)
+
+
+_default_transport: HttpTransport | None = None
+_default_lock = threading.Lock()
+
+
+def default_transport() -> HttpTransport:
+    """Return the process-wide transport shared by every command."""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
+
+
+def parse_link_header(value: str | None) -> dict[str, str]:
+    """Parse an RFC 8288 ``Link`` header into ``{rel: url}``."""
+    links: dict[str, str] = {}
+    for part in (value or "").split(","):
+        m = _LINK_RE.match(part.strip())
+        if m:
+            for rel in m.group("rel").split():
+                links[rel] = m.group("url")
+    return links
@@ -0,0 +1,85 @@
+"""Persistent ETag / Last-Modified cache for conditional GitHub API requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+
+from .http import HttpResponse
+from .utils import prune_lru
+
+# Response headers worth replaying on a 304 (pagination must keep working from cache).
+_KEPT_HEADERS = ("etag", "last-modified", "link", "content-type")
+
+
+class ResponseCache:
+    """One file per (URL, credential) holding validators, a few headers and the body.
+
+    Each file is a JSON metadata line followed by the raw body. Files are written atomically and
+    touched on every hit; ``prune`` evicts the least recently used ones once the directory grows past
+    ``max_bytes``.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, identity: str | None) -> str:
+        """Cache key for a URL as seen by a given credential (the credential itself is never stored)."""
+        return hashlib.sha256(f"{identity or ''}\0{url}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def load(self, key: str) -> HttpResponse | None:
+        """Return the cached response for key, or None."""
+        try:
+            with open(self._path(key), "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return HttpResponse(status=200, url=meta.get("url", ""), headers=meta.get("headers", {}), body=body)
+
+    @staticmethod
+    def validators(cached: HttpResponse) -> dict[str, str]:
+        """Conditional request headers for a cached response."""
+        headers: dict[str, str] = {}
+        if cached.header("etag"):
+            headers["If-None-Match"] = cached.headers["etag"]
+        if cached.header("last-modified"):
+            headers["If-Modified-Since"] = cached.headers["last-modified"]
+        return headers
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as recently used."""
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def store(self, key: str, resp: HttpResponse) -> None:
+        """Persist a 200 response that carries a validator."""
+        headers = {h: resp.headers[h] for h in _KEPT_HEADERS if h in resp.headers}
+        if "etag" not in headers and "last-modified" not in headers:
+            return
+        meta = json.dumps({"url": resp.url, "headers": headers}).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(meta + b"\n" + resp.body)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+    def prune(self) -> int:
+        """Evict least recently used responses past ``max_bytes``; call once per run, not per store."""
+        return prune_lru(self.directory, self.max_bytes)
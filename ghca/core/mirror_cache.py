@@ -0,0 +1,111 @@
+"""Persistent cache of bare repo mirrors that ``ghca clone`` creates checkouts from."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from collections.abc import Iterable
+
+from .utils import prune_lru
+
+_REFERRERS = "ghca-referrers"
+
+
+class MirrorCache:
+    """One bare repository per GitHub repo, kept under directory and shared by every clone run.
+
+    ``GitClient.refresh_mirror`` creates or incrementally fetches a mirror; checkouts then borrow its
+    objects instead of downloading them again. New mirrors are built in a hidden staging directory
+    and renamed into place, so concurrent runs never see a half-written one. Mirrors are touched on
+    use and the least recently used are evicted once the cache grows past ``max_bytes`` -- except
+    those a ``reference`` or ``worktree`` checkout still relies on (see ``add_referrer``).
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 10 * 1024 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def name(repo: dict) -> str:
+        """Cache entry name for a repo record: ``owner+name.git`` (``+`` cannot occur in GitHub names)."""
+        return repo["full_name"].replace("/", "+") + ".git"
+
+    def path(self, repo: dict) -> str:
+        """Where repo's mirror lives (it may not exist yet)."""
+        return os.path.join(self.directory, self.name(repo))
+
+    def staging(self) -> str:
+        """Create a fresh hidden directory to build a new mirror in (ignored by pruning) and return it."""
+        return tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+
+    def install(self, staged: str, path: str) -> None:
+        """Move a fully built mirror into place; if another run got there first, keep theirs."""
+        try:
+            os.rename(staged, path)
+        except OSError:
+            shutil.rmtree(staged, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+
+    @staticmethod
+    def touch(path: str) -> None:
+        """Mark a mirror as recently used."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def add_referrer(path: str, checkout: str) -> None:
+        """Record that checkout borrows objects from the mirror at path, so pruning leaves it alone."""
+        checkout = os.path.abspath(checkout)
+        referrers = os.path.join(path, _REFERRERS)
+        try:
+            with open(referrers, encoding="utf-8") as f:
+                if checkout in f.read().splitlines():
+                    return
+        except OSError:
+            pass
+        with open(referrers, "a", encoding="utf-8") as f:
+            f.write(checkout + "\n")
+
+    @staticmethod
+    def in_use(path: str) -> bool:
+        """Whether a recorded checkout still borrows objects from the mirror at path."""
+        try:
+            with open(os.path.join(path, _REFERRERS), encoding="utf-8") as f:
+                checkouts = f.read().splitlines()
+        except OSError:
+            return False
+        mirror = os.path.realpath(path) + os.sep
+        return any(_relies_on(c, mirror) for c in checkouts if c)
+
+    def prune(self, keep: Iterable[str] = ()) -> int:
+        """Evict least recently used mirrors until under the size cap.
+
+        Mirrors named in keep and mirrors a checkout still relies on are never evicted.
+        """
+        keep = set(keep)
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        keep.update(n for n in names if not n.startswith(".") and self.in_use(os.path.join(self.directory, n)))
+        return prune_lru(self.directory, self.max_bytes, keep=tuple(keep))
+
+
+def _relies_on(checkout: str, mirror: str) -> bool:
+    """Whether checkout is a linked worktree of mirror or lists mirror's objects in its alternates."""
+    dot_git = os.path.join(checkout, ".git")
+    try:
+        if os.path.isfile(dot_git):
+            with open(dot_git, encoding="utf-8") as f:
+                line = f.readline().strip()
+            gitdir = line[len("gitdir:") :].strip() if line.startswith("gitdir:") else ""
+            return bool(gitdir) and os.path.realpath(os.path.join(checkout, gitdir)).startswith(mirror)
+        with open(os.path.join(dot_git, "objects", "info", "alternates"), encoding="utf-8") as f:
+            return any(os.path.realpath(line.strip()).startswith(mirror) for line in f if line.strip())
+    except OSError:
+        return False
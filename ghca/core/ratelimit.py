@@ -0,0 +1,184 @@
+"""Rate-limit-aware scheduling for GitHub API traffic.
+
+Every request acquires a slot from a shared ``RateLimitScheduler`` before it is sent and reports the
+response back. The scheduler tracks the ``X-RateLimit-*`` budget, paces requests evenly over the
+rest of the window once the budget runs low, and turns ``Retry-After`` / secondary-rate-limit
+rejections into a process-wide pause so concurrent workers back off together.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from .constants import API_MAX_INFLIGHT, RATE_LIMIT_RESERVE
+from .http import HttpResponse
+
+
+@dataclass(frozen=True)
+class RateLimitMetrics:
+    """Point-in-time view of the scheduler's state."""
+
+    limit: int | None
+    remaining: int | None
+    reset_at: float | None
+    inflight: int
+    requests: int
+    throttled: int
+    retries: int
+    total_wait_sec: float
+    current_wait_sec: float
+
+
+def _int_header(resp: HttpResponse, name: str) -> int | None:
+    value = resp.header(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimitScheduler:
+    """Thread-safe gatekeeper shared by every ``GitHubClient`` in the process."""
+
+    def __init__(
+        self,
+        *,
+        max_inflight: int = API_MAX_INFLIGHT,
+        reserve: int = RATE_LIMIT_RESERVE,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.reserve = reserve
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_inflight)
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset_at: float | None = None
+        self._next_at = 0.0  # earliest time the next request may start
+        self._inflight = self._requests = self._throttled = self._retries = 0
+        self._total_wait = 0.0
+
+    # ---------- pacing ----------
+    def _interval(self, now: float) -> float:
+        """Spacing between requests needed to make the remaining budget last until reset."""
+        if self._remaining is None or self._reset_at is None or self._reset_at <= now:
+            return 0.0
+        if self._remaining <= 0:
+            return self._reset_at - now
+        if self._remaining > self.reserve:
+            return 0.0
+        return (self._reset_at - now) / self._remaining
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Wait until a request may be sent, then hold an in-flight slot while it runs."""
+        with self._lock:
+            now = self._clock()
+            if self._reset_at is not None and self._reset_at <= now:
+                # Window rolled over; the next response will tell us the new budget.
+                self._remaining = self._reset_at = None
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self._interval(start_at)
+            if self._remaining is not None:
+                self._remaining -= 1  # optimistic local accounting until headers arrive
+            wait = start_at - now
+            if wait > 0:
+                self._throttled += 1
+                self._total_wait += wait
+        if wait > 0:
+            self._sleep(wait)
+        self._slots.acquire()
+        with self._lock:
+            self._inflight += 1
+            self._requests += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._inflight -= 1
+            self._slots.release()
+
+    # ---------- feedback ----------
+    def observe(self, resp: HttpResponse) -> None:
+        """Update the budget from a response's rate-limit headers."""
+        limit = _int_header(resp, "x-ratelimit-limit")
+        remaining = _int_header(resp, "x-ratelimit-remaining")
+        reset = _int_header(resp, "x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        with self._lock:
+            self._limit = limit if limit is not None else self._limit
+            if self._reset_at == float(reset) and self._remaining is not None:
+                # Responses can arrive out of order; within a window the budget only shrinks.
+                self._remaining = min(self._remaining, remaining)
+            else:
+                self._remaining, self._reset_at = remaining, float(reset)
+
+    def retry_delay(self, resp: HttpResponse, attempt: int) -> float | None:
+        """Return how long to back off before retrying resp, or None if it is not a rate-limit rejection."""
+        if resp.status not in {403, 429}:
+            return None
+        retry_after = _int_header(resp, "retry-after")
+        remaining = _int_header(resp, "x-ratelimit-remaining")
+        reset = _int_header(resp, "x-ratelimit-reset")
+        secondary = b"secondary rate limit" in resp.body.lower()
+        if retry_after is None and remaining != 0 and not secondary and resp.status != 429:
+            return None  # an ordinary permission error
+        if attempt >= self.max_retries:
+            return None
+
+        jitter = random.uniform(0, self.backoff_base)
+        if retry_after is not None:
+            delay = retry_after + jitter
+        elif remaining == 0 and reset is not None:
+            delay = max(0.0, reset - self._clock()) + jitter
+        else:
+            delay = min(self.backoff_max, self.backoff_base * 2**attempt) * random.uniform(0.5, 1.5)
+
+        with self._lock:
+            self._retries += 1
+            # Pause everyone, not just the caller: the limit applies to the whole token.
+            self._next_at = max(self._next_at, self._clock() + delay)
+        return delay
+
+    def metrics(self) -> RateLimitMetrics:
+        """Return the current budget, wait and retry counters."""
+        with self._lock:
+            now = self._clock()
+            return RateLimitMetrics(
+                limit=self._limit,
+                remaining=self._remaining,
+                reset_at=self._reset_at,
+                inflight=self._inflight,
+                requests=self._requests,
+                throttled=self._throttled,
+                retries=self._retries,
+                total_wait_sec=self._total_wait,
+                current_wait_sec=max(0.0, self._next_at - now),
+            )
+
+
+_default_scheduler: RateLimitScheduler | None = None
+_default_lock = threading.Lock()
+
+
+def default_scheduler() -> RateLimitScheduler:
+    """Return the process-wide scheduler shared by every command."""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RateLimitScheduler()
+        return _default_scheduler
@@ -0,0 +1,155 @@
+"""Persistent index of the git repositories found below a directory.
+
+Discovery used to ``os.walk`` the whole tree on every command. The index records, for every directory
+it visited, its mtime and what it contained (sub-directories, or that it is a worktree / bare repo).
+On the next lookup a directory whose mtime is unchanged is trusted without listing it again, so a
+warm lookup costs one ``stat`` per directory instead of a ``scandir`` per directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+
+from .constants import CLONE_STAGING_DIR
+
+_VERSION = 1
+# A listing taken within this long of the directory's mtime may have raced a further change made in
+# the same mtime tick (coarse NFS timestamps), so it is not trusted on the next lookup.
+_RACY_NS = 2_000_000_000
+
+WORKTREE = "worktree"
+BARE = "bare"
+DIR = "dir"
+
+
+@dataclass
+class ScanStats:
+    """How much work the last lookup did."""
+
+    visited: int = 0
+    listed: int = 0
+
+
+class RepoIndex:
+    """Index of worktrees and bare repos under ``root``, cached in ``index_dir``."""
+
+    def __init__(self, root: str, index_dir: str, *, max_depth: int | None = None) -> None:
+        self.root = root
+        self.index_dir = index_dir
+        self.max_depth = max_depth
+        self._requested_depth = max_depth
+        self.stats = ScanStats()
+        key = hashlib.sha256(os.path.abspath(root).encode("utf-8")).hexdigest()[:24]
+        self.path = os.path.join(index_dir, f"{key}.json")
+        self._nodes: dict[str, dict] = {}
+        self._load()
+
+    # ---------- persistence ----------
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _VERSION or data.get("root") != os.path.abspath(self.root):
+            return
+        self._nodes = data.get("nodes", {})
+        if self.max_depth is None:
+            self.max_depth = data.get("max_depth")
+
+    def _save(self) -> None:
+        os.makedirs(self.index_dir, exist_ok=True)
+        payload = {
+            "version": _VERSION,
+            "root": os.path.abspath(self.root),
+            "max_depth": self.max_depth,
+            "nodes": self._nodes,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.index_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    # ---------- scanning ----------
+    def _list(self, path: str) -> dict:
+        self.stats.listed += 1
+        subdirs: list[str] = []
+        has_git = has_config = False
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.name == ".git":
+                        # A directory, or the file a linked worktree (`git worktree add`) points back with.
+                        has_git = entry.is_dir() or entry.is_file()
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name == "config":
+                        has_config = entry.is_file()
+                except OSError:
+                    continue
+        if has_git:
+            return {"kind": WORKTREE}
+        if path.endswith(".git") and has_config:
+            return {"kind": BARE}
+        return {"kind": DIR, "children": sorted(subdirs)}
+
+    def _visit(self, rel: str, depth: int, nodes: dict[str, dict], found: list[tuple[str, str]]) -> None:
+        path = os.path.join(self.root, rel) if rel else self.root
+        self.stats.visited += 1
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        node = self._nodes.get(rel)
+        if node is None or node.get("mtime") != mtime or node.get("listed", 0) - mtime < _RACY_NS:
+            try:
+                node = {"mtime": mtime, "listed": time.time_ns(), **self._list(path)}
+            except OSError:
+                return
+        nodes[rel] = node
+
+        if node["kind"] != DIR:
+            found.append((path, node["kind"]))
+            return
+        if self.max_depth is not None and depth >= self.max_depth:
+            return
+        for child in node["children"]:
+            if not rel and child == CLONE_STAGING_DIR:
+                continue  # clones still being built (see GitClient.clone_repo)
+            self._visit(os.path.join(rel, child) if rel else child, depth + 1, nodes, found)
+
+    def scan(self, *, rebuild: bool = False) -> list[tuple[str, str]]:
+        """Return ``(path, kind)`` for every repo under root, revalidating (or rebuilding) the index.
+
+        The max depth is remembered in the index; a rebuild resets it to the one passed in (None = unlimited).
+        """
+        if rebuild:
+            self._nodes = {}
+            self.max_depth = self._requested_depth
+        self.stats = ScanStats()
+        nodes: dict[str, dict] = {}
+        found: list[tuple[str, str]] = []
+        self._visit("", 0, nodes, found)
+        if nodes != self._nodes:
+            self._nodes = nodes
+            self._save()
+        return sorted(found)
+
+    def worktrees(self) -> list[str]:
+        """Non-bare worktrees (directories containing ``.git``, a directory or a linked worktree's file)."""
+        return [p for p, kind in self.scan() if kind == WORKTREE and not p.endswith(".git")]
+
+    def bare_repos(self) -> list[str]:
+        """Bare / mirror repositories (``*.git`` directories with a ``config`` file)."""
+        return [p for p, kind in self.scan() if kind == BARE]
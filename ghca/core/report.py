@@ -0,0 +1,112 @@
+"""Per-repo result reporting: the usual ``[ok]``/``[fail]`` lines, or NDJSON records for dashboards."""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+import threading
+import time
+from typing import Any, TextIO
+
+from .types import OutputFormat
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of values (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class Reporter:
+    """Collects one result per repo and renders it as text (default) or NDJSON.
+
+    In ``ndjson`` mode stdout carries nothing but JSON records -- a ``repo`` record per result and a
+    final ``summary`` with p50/p95/max durations -- while progress lines move to stderr. Safe to call
+    from worker threads.
+    """
+
+    def __init__(self, command: str, fmt: str = OutputFormat.text.value) -> None:
+        self.command = command
+        self.ndjson = fmt == OutputFormat.ndjson.value
+        self._lock = threading.Lock()
+        self._durations: list[float] = []
+        self._start = time.perf_counter()
+
+    @property
+    def stream(self) -> TextIO:
+        """Where free-form output (progress, child output) belongs in the current format."""
+        return sys.stderr if self.ndjson else sys.stdout
+
+    def info(self, text: str, *, error: bool = False) -> None:
+        """Print a progress line (stderr when ``error`` or in NDJSON mode)."""
+        with self._lock:
+            print(text, file=sys.stderr if error else self.stream, flush=self.ndjson)
+
+    def result(
+        self,
+        repo: str,
+        status: str,
+        *,
+        text: str | None = None,
+        error: bool = False,
+        duration: float | None = None,
+        exit_code: int | None = None,
+        size_bytes: int | None = None,
+        stages: dict[str, float] | None = None,
+        **extra: Any,
+    ) -> None:
+        """Report one repo: print ``text`` in text mode, or write a ``repo`` record in NDJSON mode."""
+        with self._lock:
+            if duration is not None:
+                self._durations.append(duration)
+            if not self.ndjson:
+                if text is not None:
+                    print(text, file=sys.stderr if error else sys.stdout)
+                return
+            record = {
+                "type": "repo",
+                "command": self.command,
+                "repo": repo,
+                "status": status,
+                "duration_sec": _round(duration),
+                "exit_code": exit_code,
+                "bytes": size_bytes,
+                "stages": {k: _round(v) for k, v in (stages or {}).items()},
+                **extra,
+            }
+            if text is not None:
+                record["message"] = text
+            self._write(record)
+
+    def summary(self, text: str, **counts: Any) -> None:
+        """Print the ``Done.`` line, or write the ``summary`` record with counts and duration percentiles."""
+        with self._lock:
+            if not self.ndjson:
+                print(text)
+                return
+            self._write(
+                {
+                    "type": "summary",
+                    "command": self.command,
+                    **counts,
+                    "repos": len(self._durations),
+                    "wall_sec": _round(time.perf_counter() - self._start),
+                    "duration_sec": {
+                        "p50": _round(percentile(self._durations, 50)),
+                        "p95": _round(percentile(self._durations, 95)),
+                        "max": _round(max(self._durations, default=None)),
+                    },
+                }
+            )
+
+    @staticmethod
+    def _write(record: dict[str, Any]) -> None:
+        sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+        sys.stdout.flush()
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 4)
@@ -0,0 +1,66 @@
+"""Content-addressed cache of ``ghca batch`` results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any
+
+from .utils import prune_lru
+
+_VERSION = 2
+
+
+class ResultCache:
+    """One JSON file per job key holding the finished job's exit status and output.
+
+    The key is derived from everything that can change a command's result (see ``key``), so an
+    entry never needs invalidating: a changed repo simply hashes to a new key. Files are written
+    atomically and touched on every hit; ``prune`` evicts the least recently used ones once the
+    directory grows past ``max_bytes``.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Cache key for a job: a digest over its JSON-serialisable inputs."""
+        blob = json.dumps([_VERSION, *parts], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(blob.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Return the stored result for key (marking it recently used), or None."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return result if isinstance(result, dict) else None
+
+    def store(self, key: str, result: dict[str, Any]) -> None:
+        """Persist a job's result."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f, separators=(",", ":"))
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+    def prune(self) -> int:
+        """Evict least recently used results past ``max_bytes``; call once per run, not per store."""
+        return prune_lru(self.directory, self.max_bytes)
@@ -0,0 +1,157 @@
+"""Chrome / Perfetto trace-event output for ``ghca --trace FILE``.
+
+Spans are recorded only while a tracer is active, so the hooks in ``GitClient``, ``GitHubClient`` and
+the service loops cost next to nothing otherwise. Each span is a complete (``X``) event on the
+thread that ran it, tagged with the repo being worked on; open the file in ``chrome://tracing`` or
+https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any
+
+_current_repo: contextvars.ContextVar[str | None] = contextvars.ContextVar("ghca_trace_repo", default=None)
+_URL_CREDENTIALS = re.compile(r"(://)[^/@\s]+@")
+
+
+class Tracer:
+    """Collects trace events in memory and writes them as one JSON file on ``save``."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._ids = itertools.count(1)
+
+    @staticmethod
+    def _now_us() -> float:
+        return time.perf_counter_ns() / 1000
+
+    def _add(self, event: dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        with self._lock:
+            self._threads.setdefault(thread.ident or 0, thread.name)
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str, *, concurrent: bool = False, **args: Any) -> Iterator[dict[str, Any]]:
+        """Record the enclosed block; the yielded dict can be filled with result args (status, bytes...).
+
+        ``concurrent`` spans (many interleaved on one thread, as in the asyncio engine) are written as
+        async begin/end pairs so viewers give each its own track instead of mis-nesting them.
+        """
+        repo = _current_repo.get()
+        if repo is not None:
+            args.setdefault("repo", repo)
+        start = self._now_us()
+        try:
+            yield args
+        finally:
+            end = self._now_us()
+            base = {"name": name, "cat": cat, "pid": self._pid, "tid": threading.get_ident()}
+            if concurrent:
+                span_id = next(self._ids)
+                self._add({**base, "ph": "b", "ts": start, "id": span_id, "args": args})
+                self._add({**base, "ph": "e", "ts": end, "id": span_id})
+            else:
+                self._add({**base, "ph": "X", "ts": start, "dur": end - start, "args": args})
+
+    def save(self) -> None:
+        """Write the trace file (Chrome JSON object format)."""
+        with self._lock:
+            meta = [
+                {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._threads.items()
+            ]
+            payload = {"traceEvents": meta + self._events, "displayTimeUnit": "ms"}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+
+
+_active: Tracer | None = None
+
+
+def start(path: str) -> Tracer:
+    """Begin tracing to path; spans recorded from now on end up in the file written by ``stop``."""
+    global _active
+    _active = Tracer(path)
+    return _active
+
+
+def stop() -> None:
+    """Write the active trace (if any) and stop tracing."""
+    global _active
+    tracer, _active = _active, None
+    if tracer is not None:
+        tracer.save()
+
+
+@contextmanager
+def span(name: str, cat: str, *, concurrent: bool = False, **args: Any) -> Iterator[dict[str, Any]]:
+    """Trace the enclosed block if tracing is on; otherwise a no-op."""
+    tracer = _active
+    if tracer is None:
+        yield args
+        return
+    with tracer.span(name, cat, concurrent=concurrent, **args) as extra:
+        yield extra
+
+
+@contextmanager
+def repo(name: str, cat: str, *, concurrent: bool = False) -> Iterator[None]:
+    """Mark the enclosed work as being for repo name: one span for it, and a tag on every span inside."""
+    token = _current_repo.set(name)
+    try:
+        with span(name, cat, concurrent=concurrent):
+            yield
+    finally:
+        _current_repo.reset(token)
+
+
+def in_repo(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap fn so spans it records on a pool thread keep the caller's repo tag."""
+    name = _current_repo.get()
+    if name is None:
+        return fn
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        token = _current_repo.set(name)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current_repo.reset(token)
+
+    return run
+
+
+@contextmanager
+def acquire(name: str, lock: AbstractContextManager) -> Iterator[None]:
+    """Hold lock (a semaphore, lock, ...) for the block, tracing the time spent waiting for it."""
+    with span(f"wait {name}", "wait"):
+        lock.__enter__()
+    try:
+        yield
+    finally:
+        lock.__exit__(None, None, None)
+
+
+def subprocess_span(cmd: list[str] | str, cwd: str | None = None) -> AbstractContextManager[dict[str, Any]]:
+    """Span for running cmd, named like ``git fetch``, with credentials in URLs masked in its argv."""
+    if _active is None:
+        return nullcontext({})
+    parts = cmd.split() if isinstance(cmd, str) else cmd
+    words = [p for p in parts[:4] if not p.startswith("-") and "=" not in p][:2]
+    name = " ".join(os.path.basename(w) if i == 0 else w for i, w in enumerate(words)) or "subprocess"
+    argv = _URL_CREDENTIALS.sub(r"\1***@", " ".join(parts))
+    return span(name, "subprocess", argv=argv, cwd=cwd)
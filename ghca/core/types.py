@@ -1,5 +1,6 @@
 """Small types and Enums used by ghca."""
 
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -9,3 +10,69 @@ class Visibility(str, Enum):
     all = "all"
     public = "public"
     private = "private"
+
+
+class ReleaseBackend(str, Enum):
+    """How releases are created."""
+
+    api = "api"  # in-process REST calls over the pooled connection
+    gh = "gh"  # spawn the GitHub CLI per repository
+
+
+class BatchEngine(str, Enum):
+    """How ``ghca batch`` drives its child processes."""
+
+    thread = "thread"  # one pool thread blocked per running child
+    asyncio = "asyncio"  # a single event loop with non-blocking pipe reads
+
+
+class CloneFilter(str, Enum):
+    """How much of each repo's history a clone downloads up front."""
+
+    full = "full"  # every commit, tree and blob
+    blobless = "blobless"  # --filter=blob:none: file contents are fetched on demand (checkout, diff)
+    treeless = "treeless"  # --filter=tree:0: trees are fetched on demand too; best for throwaway scans
+
+
+class CloneState(str, Enum):
+    """Per-repo state in the ``ghca clone`` run journal."""
+
+    pending = "pending"  # listed and queued
+    in_progress = "in-progress"  # a clone was started (a leftover target is partial)
+    done = "done"
+    failed = "failed"  # retries exhausted; cleaned up and retried on the next run
+
+
+class CacheMode(str, Enum):
+    """How ``ghca clone --mirror-cache`` makes a checkout from a cached mirror."""
+
+    dissociate = "dissociate"  # git clone --reference --dissociate: objects copied, checkout stands alone
+    reference = "reference"  # git clone --reference: objects shared through alternates
+    worktree = "worktree"  # git worktree add --detach on the mirror itself (read-only jobs)
+
+
+class OutputFormat(str, Enum):
+    """How commands report per-repo results."""
+
+    text = "text"  # human-readable [ok]/[fail] lines
+    ndjson = "ndjson"  # one JSON record per repo plus a summary record
+
+
+@dataclass(frozen=True)
+class RepoState:
+    """One-shot snapshot of a worktree from ``git status --porcelain=v2 --branch``."""
+
+    branch: str | None  # None when HEAD is detached
+    oid: str | None  # None before the first commit
+    upstream: str | None
+    ahead: int
+    behind: int
+    staged: int
+    unstaged: int
+    untracked: int
+    conflicts: int
+
+    @property
+    def dirty(self) -> bool:
+        """True if anything would show up in ``git status --porcelain``."""
+        return bool(self.staged or self.unstaged or self.untracked or self.conflicts)
@@ -1,10 +1,11 @@
-"""Lightweight helpers for batch orchestration (globs, assets)."""
+"""Lightweight helpers for batch orchestration (globs, assets, cache directories)."""
 
 from __future__ import annotations
 
 import fnmatch
 import glob
 import os
+import shutil
 from collections.abc import Sequence
 
 
@@ -14,6 +15,19 @@ def matches_any_glob(name: str, patterns: Sequence[str]) -> bool:
     return any(fnmatch.fnmatchcase(name, pat) for pat in patterns)
 
 
+def filter_dirs_by_name(dirs: Sequence[str], only_globs: Sequence[str], exclude_globs: Sequence[str]) -> list[str]:
+    """Keep dirs whose basename matches --only globs (if any) and none of the --exclude globs."""
+    out: list[str] = []
+    for d in dirs:
+        name = os.path.basename(d.rstrip(os.sep))
+        if only_globs and not matches_any_glob(name, only_globs):
+            continue
+        if exclude_globs and matches_any_glob(name, exclude_globs):
+            continue
+        out.append(d)
+    return out
+
+
 def resolve_asset_globs(repo_dir: str, patterns: Sequence[str]) -> list[str]:
     if not patterns:
         return []
@@ -21,3 +35,64 @@ def resolve_asset_globs(repo_dir: str, patterns: Sequence[str]) -> list[str]:
     for p in patterns:
         out.extend(glob.glob(os.path.join(repo_dir, p)))
     return [p for p in out if os.path.isfile(p)]
+
+
+def default_cache_dir() -> str:
+    """Per-user cache root: $GHCA_CACHE_DIR, else the platform cache dir + '/ghca'."""
+    if os.getenv("GHCA_CACHE_DIR"):
+        return os.environ["GHCA_CACHE_DIR"]
+    base = os.getenv("LOCALAPPDATA") if os.name == "nt" else os.getenv("XDG_CACHE_HOME")
+    return os.path.join(base or os.path.join(os.path.expanduser("~"), ".cache"), "ghca")
+
+
+def path_size(path: str) -> int:
+    """Size in bytes of a file, or of everything below a directory."""
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.lstat(os.path.join(root, f)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def prune_lru(root: str, max_bytes: int, *, keep: Sequence[str] = ()) -> int:
+    """Delete the least recently used entries directly under root until it fits in max_bytes.
+
+    Recency is the entry's mtime, so callers mark use with ``os.utime``. Entries named in ``keep``
+    and hidden (dot-prefixed, e.g. in-flight temp files) are never removed. Returns the number of
+    entries deleted.
+    """
+    try:
+        names = os.listdir(root)
+    except FileNotFoundError:
+        return 0
+    entries = []
+    for name in names:
+        if name.startswith("."):
+            continue
+        path = os.path.join(root, name)
+        try:
+            entries.append((os.stat(path).st_mtime, path_size(path), path))
+        except OSError:
+            continue
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.basename(path) in keep:
+            continue
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
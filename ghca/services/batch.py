@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+import re
 import shlex
+import signal
 import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, TextIO
 
+from ..core import trace
+from ..core.constants import CLONE_STAGING_DIR
 from ..core.git_client import GitClient
+from ..core.report import Reporter
+from ..core.result_cache import ResultCache
+from ..core.types import BatchEngine, OutputFormat
 from ..core.utils import matches_any_glob
 
+# Keeps streamed lines from concurrent jobs from tearing into each other.
+_print_lock = threading.Lock()
+_UNSAFE_LOG_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+# How long a stopped job gets to exit after SIGTERM before it is killed.
+_KILL_GRACE_SEC = 5.0
+_CACHED_MARK = " (cached)"
+_EXIT_RE = re.compile(r"\(exit (-?\d+)\)")
+# Pipe read size for the asyncio engine; also its longest line when streaming.
+_READ_CHUNK = 1024 * 1024
+
 
 def _list_target_dirs(dest: str, only_git: bool, recursive: bool) -> list[str]:
     if only_git:
@@ -24,7 +49,7 @@ def _list_target_dirs(dest: str, only_git: bool, recursive: bool) -> list[str]:
             if root == dest:
                 # keep walking but don't add root
                 for d in list(dirs):
-                    if d.startswith(".git"):  # prune .git folders quickly
+                    if d.startswith(".git") or d == CLONE_STAGING_DIR:  # prune .git folders and unfinished clones
                         dirs.remove(d)
                 continue
             targets.append(root)
@@ -35,7 +60,7 @@ def _list_target_dirs(dest: str, only_git: bool, recursive: bool) -> list[str]:
     else:
         for name in os.listdir(dest):
             path = os.path.join(dest, name)
-            if os.path.isdir(path):
+            if os.path.isdir(path) and name != CLONE_STAGING_DIR:
                 targets.append(path)
     return sorted(targets)
 
@@ -50,12 +75,119 @@ def _parse_env(env_kvs: list[str]) -> dict[str, str]:
     return env
 
 
+class _JobControl:
+    """The running children of one batch, so fail-fast and timeouts can stop them.
+
+    Each child is started in its own session (process group) so stopping it also stops whatever it
+    spawned: SIGTERM to the group, then SIGKILL once the grace period is over.
+    """
+
+    def __init__(self, grace: float = _KILL_GRACE_SEC) -> None:
+        self.grace = grace
+        self.cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._running: set[subprocess.Popen] = set()
+        self._stopped: set[subprocess.Popen] = set()
+
+    def spawn(self, args: str | list[str], **kwargs: Any) -> subprocess.Popen | None:
+        """Start a child, or return None if the batch has already been cancelled."""
+        if self.cancelled.is_set():
+            return None
+        # fork/exec happens outside the lock so concurrent spawns do not queue up behind each other.
+        proc = subprocess.Popen(args, start_new_session=True, **kwargs)
+        with self._lock:
+            self._running.add(proc)
+            cancelled = self.cancelled.is_set()
+        if cancelled:  # cancelled while we were starting it; cancel() may not have seen it
+            self.stop([proc])
+        return proc
+
+    def release(self, proc: subprocess.Popen) -> None:
+        """Forget a child that has exited."""
+        with self._lock:
+            self._running.discard(proc)
+
+    def was_stopped(self, proc: subprocess.Popen) -> bool:
+        """Whether proc exited because stop() was called on it."""
+        with self._lock:
+            return proc in self._stopped
+
+    def stop(self, procs: list[subprocess.Popen]) -> None:
+        """Terminate the process groups of procs, killing any still alive after the grace period."""
+        with self._lock:
+            self._stopped.update(procs)
+        for p in procs:
+            _signal_group(p, hard=False)
+        deadline = time.monotonic() + self.grace
+        for p in procs:
+            try:
+                p.wait(max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                _signal_group(p, hard=True)
+
+    def cancel(self) -> None:
+        """Start no more children and stop the running ones."""
+        with self._lock:
+            self.cancelled.set()
+            running = list(self._running)
+        self.stop(running)
+
+
+def _signal_group(proc: subprocess.Popen | asyncio.subprocess.Process, *, hard: bool) -> None:
+    # Once a child has been reaped its pid, and so its group id, may belong to another process.
+    if (proc.poll() if isinstance(proc, subprocess.Popen) else proc.returncode) is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL if hard else signal.SIGTERM)
+        elif hard:
+            proc.kill()
+        else:
+            proc.terminate()
+    except OSError:
+        pass  # already gone
+
+
+def _exit_status(name: str, code: int, *, timed_out: bool, stopped: bool, timeout: float | None) -> tuple[bool, str]:
+    if timed_out:
+        return False, f"[timeout] {name} after {timeout:g}s"
+    if code == 0:
+        return True, f"[ok] {name}"
+    if stopped:
+        return False, f"[cancelled] {name}"
+    return False, f"[fail] {name} (exit {code})"
+
+
+def _with_output(name: str, msg: str, out: str, err: str) -> str:
+    out = out.strip()
+    err = err.strip()
+    if out:
+        msg += f"\n[out] {name}:\n{out}"
+    if err:
+        msg += f"\n[err] {name}:\n{err}"
+    return msg
+
+
+def _failure_report(name: str, ok: bool, msg: str, log_path: str | None, tail: deque[str]) -> str:
+    if ok or msg.startswith("[cancelled]"):
+        return ""
+    report = msg
+    if log_path:
+        report += f", full log: {log_path}"
+    if tail:
+        report += f"\n[tail] {name} (last {len(tail)} lines):\n" + "\n".join(tail)
+    return report
+
+
 def _run_one(
     cwd: str,
     cmd: list[str],
     use_shell: bool,
     inherit_env: dict[str, str],
     dry_run: bool,
+    *,
+    control: _JobControl,
+    timeout: float | None = None,
 ) -> tuple[str, bool, str]:
     name = os.path.basename(cwd.rstrip(os.sep))
     if dry_run:
@@ -63,23 +195,299 @@ def _run_one(
         return name, True, f"[dry-run] {name}: {printable}"
 
     try:
+        # With use_shell, run via platform shell. Join a safe string for POSIX; on Windows, shell=True uses cmd.exe.
+        proc = control.spawn(
+            " ".join(cmd) if use_shell else cmd,
+            cwd=cwd,
+            shell=use_shell,
+            env=inherit_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if proc is None:
+            return name, False, f"[cancelled] {name}"
+        timed_out = False
+        try:
+            try:
+                out, err = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                control.stop([proc])
+                out, err = proc.communicate()
+        finally:
+            control.release(proc)
+
+        ok, msg = _exit_status(
+            name, proc.returncode, timed_out=timed_out, stopped=control.was_stopped(proc), timeout=timeout
+        )
+        return name, ok, _with_output(name, msg, out, err)
+    except Exception as e:
+        return name, False, f"[fail] {name}: {e!r}"
+
+
+def _captured_output(path: str, limit: int | None) -> dict[str, Any]:
+    """Read the output a streaming job wrote to path for the result cache: all of it, or the last limit lines."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        if limit is None:
+            return {"output": f.read(), "output_skipped": 0}
+        tail: deque[str] = deque(maxlen=limit)
+        total = 0
+        for line in f:
+            tail.append(line)
+            total += 1
+    return {"output": "".join(tail), "output_skipped": total - len(tail)}
+
+
+def _mark_cached(text: str) -> str:
+    first, sep, rest = text.partition("\n")
+    return f"{first}{_CACHED_MARK}{sep}{rest}" if text else text
+
+
+def _log_path(log_dir: str, dest: str, cwd: str) -> str:
+    rel = os.path.relpath(cwd, dest)
+    return os.path.join(log_dir, _UNSAFE_LOG_CHARS.sub("_", rel.replace(os.sep, "__")) + ".log")
+
+
+def _run_one_streaming(
+    cwd: str,
+    cmd: list[str],
+    use_shell: bool,
+    inherit_env: dict[str, str],
+    *,
+    echo: TextIO | None,
+    tail_lines: int,
+    log_path: str | None,
+    control: _JobControl,
+    timeout: float | None = None,
+) -> tuple[str, bool, str, str]:
+    """Run cmd reading its output line by line instead of buffering it all.
+
+    Lines (stdout and stderr merged, in order) are echoed to ``echo`` as they arrive if given, written
+    in full to ``log_path`` if given, and only the last ``tail_lines`` are kept in memory. Returns
+    ``(name, ok, status line, failure report)``; the report is empty on success.
+    """
+    name = os.path.basename(cwd.rstrip(os.sep))
+    tail: deque[str] = deque(maxlen=tail_lines)
+    log = None
+    timed_out = threading.Event()
+    try:
+        if log_path:
+            log = open(log_path, "w", encoding="utf-8")
+        proc = control.spawn(
+            " ".join(cmd) if use_shell else cmd,
+            cwd=cwd,
+            shell=use_shell,
+            env=inherit_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+        if proc is None:
+            return name, False, f"[cancelled] {name}", ""
+
+        def _expire() -> None:
+            timed_out.set()
+            control.stop([proc])
+
+        timer = threading.Timer(timeout, _expire) if timeout else None
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        try:
+            with proc:
+                for line in proc.stdout:
+                    if log is not None:
+                        log.write(line)
+                    line = line.rstrip("\n")
+                    tail.append(line)
+                    if echo is not None:
+                        with _print_lock:
+                            print(f"{name} | {line}", file=echo, flush=True)
+        finally:
+            if timer is not None:
+                timer.cancel()
+            control.release(proc)
+        code = proc.returncode
+    except Exception as e:
+        return name, False, f"[fail] {name}: {e!r}", ""
+    finally:
+        if log is not None:
+            log.close()
+
+    ok, msg = _exit_status(name, code, timed_out=timed_out.is_set(), stopped=control.was_stopped(proc), timeout=timeout)
+    return name, ok, msg, _failure_report(name, ok, msg, log_path, tail)
+
+
+# ---------- asyncio engine ----------
+class _AsyncJobControl:
+    """Event-loop counterpart of ``_JobControl``."""
+
+    def __init__(self, grace: float = _KILL_GRACE_SEC) -> None:
+        self.grace = grace
+        self.cancelled = False
+        self._running: set[asyncio.subprocess.Process] = set()
+        self._stopped: set[asyncio.subprocess.Process] = set()
+
+    async def spawn(self, cmd: list[str], use_shell: bool, **kwargs: Any) -> asyncio.subprocess.Process | None:
+        """Start a child, or return None if the batch has already been cancelled."""
+        if self.cancelled:
+            return None
         if use_shell:
-            # Run via platform shell. Join a safe string for POSIX; on Windows, shell=True uses cmd.exe.
-            proc = subprocess.run(" ".join(cmd), cwd=cwd, shell=True, env=inherit_env, capture_output=True, text=True)
+            proc = await asyncio.create_subprocess_shell(" ".join(cmd), start_new_session=True, **kwargs)
         else:
-            proc = subprocess.run(cmd, cwd=cwd, shell=False, env=inherit_env, capture_output=True, text=True)
-
-        ok = proc.returncode == 0
-        out = proc.stdout.strip()
-        err = proc.stderr.strip()
-        msg = f"[ok] {name}" if ok else f"[fail] {name} (exit {proc.returncode})"
-        if out:
-            msg += f"\n[out] {name}:\n{out}"
-        if err:
-            msg += f"\n[err] {name}:\n{err}"
-        return name, ok, msg
+            proc = await asyncio.create_subprocess_exec(*cmd, start_new_session=True, **kwargs)
+        self._running.add(proc)
+        if self.cancelled:  # cancelled while we were starting it
+            await self.stop([proc])
+        return proc
+
+    def release(self, proc: asyncio.subprocess.Process) -> None:
+        """Forget a child that has exited."""
+        self._running.discard(proc)
+
+    def was_stopped(self, proc: asyncio.subprocess.Process) -> bool:
+        """Whether proc exited because stop() was called on it."""
+        return proc in self._stopped
+
+    async def stop(self, procs: list[asyncio.subprocess.Process]) -> None:
+        """Terminate the process groups of procs, killing any still alive after the grace period."""
+        self._stopped.update(procs)
+        for p in procs:
+            _signal_group(p, hard=False)
+        try:
+            await asyncio.wait_for(asyncio.gather(*(p.wait() for p in procs)), self.grace)
+        except TimeoutError:
+            for p in procs:
+                if p.returncode is None:
+                    _signal_group(p, hard=True)
+            await asyncio.gather(*(p.wait() for p in procs))
+
+    async def cancel(self) -> None:
+        """Start no more children and stop the running ones."""
+        self.cancelled = True
+        await self.stop(list(self._running))
+
+
+async def _run_one_async(
+    cwd: str,
+    cmd: list[str],
+    use_shell: bool,
+    inherit_env: dict[str, str],
+    *,
+    streaming: bool,
+    echo: TextIO | None,
+    tail_lines: int,
+    log_path: str | None,
+    control: _AsyncJobControl,
+    timeout: float | None = None,
+) -> tuple[str, bool, str, str]:
+    """Run one job on the event loop; same contract and output as ``_run_one`` / ``_run_one_streaming``."""
+    name = os.path.basename(cwd.rstrip(os.sep))
+    tail: deque[str] = deque(maxlen=tail_lines)
+    out: list[bytes] = []
+    err: list[bytes] = []
+    log = None
+
+    def _emit(raw: bytes, eol: str) -> None:
+        text = raw.decode("utf-8", "replace")
+        if log is not None:
+            log.write(text + eol)
+        lines = text.split("\n")
+        tail.extend(lines)
+        if echo is not None:
+            echo.write("".join(f"{name} | {line}\n" for line in lines))
+            echo.flush()
+
+    async def _read_lines(stream: asyncio.StreamReader) -> None:
+        # Whole chunks at a time: one decode and one terminal write per chunk rather than per line.
+        pending = b""
+        while chunk := await stream.read(_READ_CHUNK):
+            complete, sep, pending = (pending + chunk).rpartition(b"\n")
+            if sep:
+                _emit(complete, "\n")
+        if pending:
+            _emit(pending, "")
+
+    async def _read_all(stream: asyncio.StreamReader, buf: list[bytes]) -> None:
+        while chunk := await stream.read(_READ_CHUNK):
+            buf.append(chunk)
+
+    try:
+        if log_path:
+            log = open(log_path, "w", encoding="utf-8")
+        proc = await control.spawn(
+            cmd,
+            use_shell,
+            cwd=cwd,
+            env=inherit_env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT if streaming else asyncio.subprocess.PIPE,
+            limit=_READ_CHUNK,
+        )
+        if proc is None:
+            return name, False, f"[cancelled] {name}", ""
+        readers = (
+            [_read_lines(proc.stdout)] if streaming else [_read_all(proc.stdout, out), _read_all(proc.stderr, err)]
+        )
+        timed_out = False
+        try:
+            await asyncio.wait_for(asyncio.gather(*readers, proc.wait()), timeout)
+        except TimeoutError:
+            timed_out = True
+        finally:
+            if proc.returncode is None:
+                await control.stop([proc])
+            control.release(proc)
     except Exception as e:
-        return name, False, f"[fail] {name}: {e!r}"
+        return name, False, f"[fail] {name}: {e!r}", ""
+    finally:
+        if log is not None:
+            log.close()
+
+    ok, msg = _exit_status(
+        name, proc.returncode, timed_out=timed_out, stopped=control.was_stopped(proc), timeout=timeout
+    )
+    if streaming:
+        return name, ok, msg, _failure_report(name, ok, msg, log_path, tail)
+    decode = functools.partial(bytes.decode, encoding="utf-8", errors="replace")
+    return name, ok, _with_output(name, msg, decode(b"".join(out)), decode(b"".join(err))), ""
+
+
+async def _run_all_async(
+    targets: list[str],
+    run_one: Callable[[str, _AsyncJobControl], Awaitable[tuple[str, bool, str, str]]],
+    record: Callable[[str, tuple[str, bool, str, str]], None],
+    *,
+    jobs: int,
+    fail_fast: bool,
+) -> int:
+    """Run every target on one event loop, ``jobs`` at a time; returns how many never started."""
+    control = _AsyncJobControl()
+    slots = asyncio.Semaphore(jobs)
+
+    async def _guarded(d: str) -> tuple[str, tuple[str, bool, str, str] | None]:
+        async with slots:
+            if control.cancelled:
+                return d, None
+            result = await run_one(d, control)
+            # Cancel before giving up the slot, so (as with threads) no further job starts after a failure.
+            if fail_fast and not result[1] and not control.cancelled:
+                await control.cancel()
+            return d, result
+
+    # Create the tasks up front, in order, so jobs start in target order as slots free up.
+    tasks = [asyncio.ensure_future(_guarded(d)) for d in targets]
+    not_started = 0
+    for next_done in asyncio.as_completed(tasks):
+        d, result = await next_done
+        if result is None:
+            not_started += 1
+            continue
+        record(d, result)
+    return not_started
 
 
 def batch_run_command(
@@ -95,10 +503,41 @@ def batch_run_command(
     dry_run: bool,
     shell: bool,
     extra_env: list[str],
+    stream: bool = False,
+    tail_lines: int = 50,
+    log_dir: str | None = None,
+    timeout: float | None = None,
+    engine: str = BatchEngine.thread.value,
+    cache_dir: str | None = None,
+    cache_max_mb: int = 256,
+    cache_env: list[str] | None = None,
+    output_format: str = OutputFormat.text.value,
 ) -> None:
+    """Run cmd in every target folder under dest, ``jobs`` at a time.
+
+    By default each command's output is captured and printed when it finishes. With ``stream`` (or
+    ``log_dir``) output is read line by line: streamed live prefixed with the folder name, written in
+    full to ``<log_dir>/<folder>.log``, and only the last ``tail_lines`` per failed folder are kept
+    for the failure report printed at the end.
+
+    ``timeout`` (seconds) stops a job that runs too long. ``fail_fast`` cancels jobs not yet started
+    and stops running ones after the first failure; stopping a job terminates its whole process group.
+
+    ``engine`` picks how children are driven: a thread per running job (``thread``) or a single
+    asyncio event loop (``asyncio``), which needs fewer threads. Output and ``fail_fast`` behave the same.
+
+    With ``cache_dir``, finished results (exit status and output) are stored under a key made of
+    the folder, command, ``--env`` values, the ``cache_env`` variables and the repo's tree state
+    (HEAD tree plus a digest of uncommitted changes); a git repo whose key is already cached is
+    replayed instead of run. The cache is LRU-evicted past ``cache_max_mb`` when the run ends.
+
+    ``output_format="ndjson"`` writes a record per folder (status, exit code, cache/run timings) and a
+    summary record to stdout; everything else, streamed output included, goes to stderr.
+    """
+    reporter = Reporter("batch", output_format)
     targets = _list_target_dirs(dest, only_git=only_git, recursive=recursive)
     if not targets:
-        print("No target folders found.")
+        reporter.info("No target folders found.")
         return
 
     # Filter by globs against folder basename
@@ -112,35 +551,229 @@ def batch_run_command(
         filtered.append(d)
 
     if not filtered:
-        print("No target folders remain after filters.")
+        reporter.info("No target folders remain after filters.")
         return
 
-    print(f"Running in {len(filtered)} folder(s) (jobs={jobs})...")
-    ok_count = fail_count = 0
+    reporter.info(f"Running in {len(filtered)} folder(s) (jobs={jobs})...")
+    ok_count = fail_count = cancel_count = 0
+    control = _JobControl()
 
     # Prepare env for children
     base_env = os.environ.copy()
-    if extra_env:
-        base_env.update(_parse_env(extra_env))
-
-    if jobs <= 1:
-        for d in filtered:
-            name, ok, msg = _run_one(d, cmd, shell, base_env, dry_run)
-            print(msg)
-            ok_count += 1 if ok else 0
-            fail_count += 0 if ok else 1
-            if fail_fast and not ok:
+    parsed_env = _parse_env(extra_env) if extra_env else {}
+    base_env.update(parsed_env)
+
+    streaming = (stream or log_dir is not None) and not dry_run
+    if streaming and log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+
+    cache = ResultCache(cache_dir, cache_max_mb * 1024 * 1024) if cache_dir and not dry_run else None
+    git = GitClient()
+    keyed_env = sorted({**parsed_env, **{n: os.environ.get(n) for n in cache_env or []}}.items())
+
+    def _lookup(d: str) -> tuple[str | None, tuple[str, bool, str, str] | None]:
+        """Return (cache key, replayed result); both None when caching is off or d is not a git repo."""
+        if cache is None:
+            return None, None
+        state = git.tree_state(d)
+        if state is None:
+            return None, None
+        key = cache.key(os.path.abspath(d), cmd, shell, keyed_env, streaming, stream, bool(log_dir), tail_lines, state)
+        hit = cache.load(key)
+        if hit is None:
+            return key, None
+        _replay(d, hit)
+        return key, (hit["name"], hit["ok"], _mark_cached(hit["msg"]), _mark_cached(hit["report"]))
+
+    def _replay(d: str, hit: dict[str, Any]) -> None:
+        """Re-emit a cached streaming job's output to its log file and the stream, as the real run did."""
+        output = hit.get("output")
+        if output is None:
+            return
+        if log_dir:
+            with open(_log_path(log_dir, dest, d), "w", encoding="utf-8") as f:
+                f.write(output)
+        if stream:
+            lines = output.splitlines()
+            if hit.get("output_skipped"):
+                lines.insert(0, f"... ({hit['output_skipped']} earlier lines were not cached)")
+            with _print_lock:
+                reporter.stream.write("".join(f"{hit['name']} | {line}\n" for line in lines))
+                reporter.stream.flush()
+
+    def _output_path(d: str, key: str | None) -> str | None:
+        """Where a streaming job writes its output: its --log-dir file, or a scratch file to cache it from."""
+        if not streaming:
+            return None
+        if log_dir:
+            return _log_path(log_dir, dest, d)
+        if key is None:
+            return None
+        fd, path = tempfile.mkstemp(dir=cache.directory, prefix=".tmp-out-")
+        os.close(fd)
+        return path
+
+    def _remember(
+        key: str | None, result: tuple[str, bool, str, str], output_path: str | None
+    ) -> tuple[str, bool, str, str]:
+        name, ok, msg, report = result
+        status = msg.partition("\n")[0]
+        try:
+            # Only real exits are cached; timeouts, cancellations and spawn errors say nothing about the tree.
+            if key is not None and (ok or (status.startswith("[fail]") and " (exit " in status)):
+                entry = {"name": name, "ok": ok, "msg": msg, "report": report}
+                if output_path:
+                    # The full log when there is one to restore, otherwise as much as a run keeps in memory.
+                    entry.update(_captured_output(output_path, None if log_dir else tail_lines))
+                cache.store(key, entry)
+        finally:
+            if output_path and not log_dir:
+                os.remove(output_path)
+        return result
+
+    # Per-folder stage timings, filled in by workers and consumed when the result is reported.
+    timings: dict[str, dict[str, float]] = {}
+
+    def _run(d: str) -> tuple[str, bool, str, str]:
+        stages = timings[d] = {}
+        with trace.repo(os.path.basename(d.rstrip(os.sep)), "batch"):
+            t0 = time.perf_counter()
+            key, hit = _lookup(d)
+            if cache is not None:
+                stages["cache"] = time.perf_counter() - t0
+            if hit:
+                return hit
+            output_path = _output_path(d, key)
+            t0 = time.perf_counter()
+            with trace.subprocess_span(cmd, d):
+                result = _execute(d, output_path)
+            stages["run"] = time.perf_counter() - t0
+        return _remember(key, result, output_path)
+
+    def _execute(d: str, output_path: str | None) -> tuple[str, bool, str, str]:
+        if not streaming:
+            return (*_run_one(d, cmd, shell, base_env, dry_run, control=control, timeout=timeout), "")
+        return _run_one_streaming(
+            d,
+            cmd,
+            shell,
+            base_env,
+            echo=reporter.stream if stream else None,
+            tail_lines=tail_lines,
+            log_path=output_path,
+            control=control,
+            timeout=timeout,
+        )
+
+    failures: list[str] = []
+    cached_count = 0
+
+    def _record(d: str, result: tuple[str, bool, str, str]) -> None:
+        nonlocal ok_count, fail_count, cancel_count, cached_count
+        name, ok, msg, report = result
+        first = msg.partition("\n")[0]
+        cached = first.endswith(_CACHED_MARK)
+        cached_count += cached
+        if ok:
+            ok_count += 1
+            status = "ok"
+        elif first.startswith("[cancelled]"):
+            cancel_count += 1
+            status = "cancelled"
+        else:
+            fail_count += 1
+            status = "timeout" if first.startswith("[timeout]") else "failed"
+        exit_match = _EXIT_RE.search(first)
+        stages = timings.pop(d, {})
+        with _print_lock:
+            reporter.result(
+                name,
+                status,
+                text=msg,
+                duration=sum(stages.values()) if stages else None,
+                exit_code=int(exit_match.group(1)) if exit_match else (0 if ok and not dry_run else None),
+                stages=stages,
+                path=d,
+                cached=cached,
+            )
+        if report:
+            failures.append(report)
+
+    if engine == BatchEngine.asyncio.value and not dry_run:
+
+        async def _run_async(d: str, control: _AsyncJobControl) -> tuple[str, bool, str, str]:
+            # Jobs interleave on the loop thread, so their spans are async (one track per job).
+            with trace.repo(os.path.basename(d.rstrip(os.sep)), "batch", concurrent=True):
+                return await _run_traced(d, control)
+
+        async def _run_traced(d: str, control: _AsyncJobControl) -> tuple[str, bool, str, str]:
+            stages = timings[d] = {}
+            key, hit = None, None
+            if cache is not None:
+                t0 = time.perf_counter()
+                key, hit = await asyncio.to_thread(_lookup, d)
+                stages["cache"] = time.perf_counter() - t0
+            if hit:
+                return hit
+            output_path = _output_path(d, key)
+            t0 = time.perf_counter()
+            result = await _run_one_async(
+                d,
+                cmd,
+                shell,
+                base_env,
+                streaming=streaming,
+                echo=reporter.stream if stream else None,
+                tail_lines=tail_lines,
+                log_path=output_path,
+                control=control,
+                timeout=timeout,
+            )
+            stages["run"] = time.perf_counter() - t0
+            # Writing the entry (and its captured output) is file I/O; keep it off the loop like _lookup.
+            return await asyncio.to_thread(_remember, key, result, output_path)
+
+        not_started = asyncio.run(_run_all_async(filtered, _run_async, _record, jobs=jobs, fail_fast=fail_fast))
+        cancel_count += not_started
+    elif jobs <= 1:
+        for i, d in enumerate(filtered):
+            result = _run(d)
+            _record(d, result)
+            if fail_fast and not result[1]:
+                cancel_count += len(filtered) - i - 1
                 break
     else:
+
+        def _guarded(d: str) -> tuple[str, bool, str, str] | None:
+            if control.cancelled.is_set():
+                return None
+            result = _run(d)
+            # Cancel from the worker, before it picks up its next job, so nothing starts after a failure.
+            if fail_fast and not result[1]:
+                control.cancel()
+            return result
+
         with ThreadPoolExecutor(max_workers=jobs) as pool:
-            futures = {pool.submit(_run_one, d, cmd, shell, base_env, dry_run): d for d in filtered}
+            futures = {pool.submit(_guarded, d): d for d in filtered}
             for fut in as_completed(futures):
-                name, ok, msg = fut.result()
-                print(msg)
-                ok_count += 1 if ok else 0
-                fail_count += 0 if ok else 1
-                if fail_fast and not ok:
-                    # Best-effort: we can't cancel running tasks cleanly; just report and stop consuming.
-                    break
-
-    print(f"Done. ok={ok_count}, failed={fail_count}.")
+                result = None if fut.cancelled() else fut.result()
+                if result is None:
+                    cancel_count += 1  # never started
+                    continue
+                _record(futures[fut], result)
+                if control.cancelled.is_set():
+                    for f in futures:
+                        f.cancel()
+
+    if cache is not None:
+        cache.prune()
+    if failures:
+        reporter.info("\nFailures:")
+        for report in failures:
+            reporter.info(report)
+    summary = f"Done. ok={ok_count}, failed={fail_count}"
+    if cancel_count:
+        summary += f", cancelled={cancel_count}"
+    if cache is not None:
+        summary += f", cached={cached_count}"
+    reporter.summary(f"{summary}.", ok=ok_count, failed=fail_count, cancelled=cancel_count, cached=cached_count)
@@ -2,12 +2,100 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import os
-import sys
+import random
+import re
+import shutil
+import threading
 import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from ..core import trace
+from ..core.clone_journal import CloneJournal
+from ..core.constants import API_BASE, CLONE_JOURNAL_FILE, CLONE_STAGING_DIR, PAGE_FETCH_CONCURRENCY
 from ..core.git_client import GitClient
 from ..core.github_client import GitHubClient
+from ..core.http_cache import ResponseCache
+from ..core.mirror_cache import MirrorCache
+from ..core.report import Reporter
+from ..core.types import CacheMode, CloneFilter, CloneState, OutputFormat
+
+
+def _backoff_delay(attempt: int, base: float, cap: float = 60.0) -> float:
+    """Exponential backoff with jitter before retry number ``attempt + 1``."""
+    return min(cap, base * 2**attempt) * random.uniform(0.5, 1.5)
+
+
+# git's messages for failures worth retrying: the network or the server, not the request itself.
+_TRANSIENT_ERRORS = re.compile(
+    r"could not resolve host|temporary failure in name resolution|failed to connect|connection refused"
+    r"|connection reset|connection timed out|operation timed out|remote end hung up|early eof|rpc failed"
+    r"|unexpected disconnect|transfer closed|gnutls_handshake|ssl_(?:read|write|connect)"
+    r"|returned error: (?:429|5\d\d)",
+    re.IGNORECASE,
+)
+
+
+def _is_transient(error: str | None) -> bool:
+    """Whether a failed clone is worth retrying (a missing repo or refused login is not)."""
+    return bool(error and _TRANSIENT_ERRORS.search(error))
+
+
+def _discard_stale_staging(dest: str, journal: CloneJournal) -> int:
+    """Delete what killed runs left in ``<dest>/.ghca-partial``, except for repos still pending or in progress."""
+    staging = os.path.join(dest, CLONE_STAGING_DIR)
+    try:
+        names = os.listdir(staging)
+    except OSError:
+        return 0
+    owned: set[str] = set()
+    for repo, entry in journal.entries.items():
+        if entry.get("state") in (CloneState.pending.value, CloneState.in_progress.value):
+            name = repo.rsplit("/", 1)[-1]
+            owned.update((name, name + ".git"))
+    removed = 0
+    for name in names:
+        if name in owned:
+            continue
+        path = os.path.join(staging, name)
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except OSError:
+            continue
+        removed += 1
+    return removed
+
+
+def build_github_client(
+    token: str | None,
+    *,
+    api_base: str = API_BASE,
+    page_jobs: int = PAGE_FETCH_CONCURRENCY,
+    http_cache_dir: str | None = None,
+    http_cache_max_mb: int = 64,
+) -> GitHubClient:
+    """GitHub client for org listing, with the on-disk response cache when a directory is given."""
+    cache = ResponseCache(http_cache_dir, http_cache_max_mb * 1024 * 1024) if http_cache_dir else None
+    return GitHubClient(token=token, api_base=api_base, page_concurrency=page_jobs, cache=cache)
+
+
+def print_api_metrics(gh: GitHubClient, reporter: Reporter | None = None) -> None:
+    """Print the rate-limit scheduler's counters for this run."""
+    m = gh.scheduler.metrics()
+    line = (
+        f"API: requests={m.requests}, budget={m.remaining}/{m.limit}, "
+        f"throttled={m.throttled}, retries={m.retries}, waited={m.total_wait_sec:.1f}s."
+    )
+    if reporter is None:
+        print(line)
+    else:
+        reporter.info(line)
 
 
 def clone_org(
@@ -19,29 +107,156 @@ def clone_org(
     shallow: bool,
     include_archived: bool,
     visibility: str,
+    jobs: int = 1,
+    max_connections: int | None = None,
+    api_base: str = API_BASE,
+    page_jobs: int = PAGE_FETCH_CONCURRENCY,
+    http_cache_dir: str | None = None,
+    http_cache_max_mb: int = 64,
+    output_format: str = OutputFormat.text.value,
+    clone_filter: str = CloneFilter.full.value,
+    sparse: Sequence[str] = (),
+    mirror_cache_dir: str | None = None,
+    mirror_cache_mode: str = CacheMode.dissociate.value,
+    mirror_cache_max_mb: int = 10240,
+    retries: int = 2,
+    retry_backoff: float = 2.0,
 ) -> None:
-    """Clone all repositories for an org into the destination directory."""
-    os.makedirs(dest, exist_ok=True)
+    """Clone all repositories for an org into the destination directory.
 
-    gh = GitHubClient(token=token)
-    repos = gh.list_org_repos(org, include_archived=include_archived, visibility=visibility)
-    if not repos:
-        print("No repositories found (check org name / permissions).")
-        return
+    ``jobs`` bounds the number of clones in flight; ``max_connections`` separately bounds how many of
+    them may be transferring from the remote host at once (defaults to ``jobs``). With
+    ``http_cache_dir`` set, API listings are revalidated with ETags instead of re-downloaded.
+    ``output_format="ndjson"`` reports per-repo records with stage timings and pack bytes received instead.
+    ``clone_filter`` and ``sparse`` make partial / sparse clones (see ``GitClient.clone_repo``).
+    With ``mirror_cache_dir``, each repo is fetched into a persistent bare mirror there and checked out
+    from it (``mirror_cache_mode``); past the size cap, mirrors neither used by this run nor still
+    borrowed from by an earlier ``reference``/``worktree`` checkout are evicted.
+
+    Progress is journaled per repo in ``<dest>/.ghca-clone.journal``, so rerunning after an interrupted
+    or partly failed run clones what it did not finish. Unfinished clones never occupy their target
+    (see ``GitClient.clone_repo``). A clone that failed on a network error is retried up to
+    ``retries`` times, with exponential backoff from ``retry_backoff`` seconds.
+    """
+    os.makedirs(dest, exist_ok=True)
 
-    print(f"Found {len(repos)} repositories. Cloning to '{dest}'...")
+    gh = build_github_client(
+        token,
+        api_base=api_base,
+        page_jobs=page_jobs,
+        http_cache_dir=http_cache_dir,
+        http_cache_max_mb=http_cache_max_mb,
+    )
+    reporter = Reporter("clone", output_format)
+    journal = CloneJournal(os.path.join(dest, CLONE_JOURNAL_FILE))
+    _discard_stale_staging(dest, journal)
+    unfinished = sum(n for state, n in journal.counts().items() if state != CloneState.done.value)
+    if unfinished:
+        reporter.info(f"Resuming: {unfinished} repo(s) unfinished in the last run will be retried.")
+    reporter.info(f"Listing '{org}' and cloning to '{dest}' (jobs={jobs})...")
     start = time.time()
-    successes = 0
+    total = successes = 0
+    report_lock = threading.Lock()
 
     git = GitClient()
-    for r in repos:
-        ok, msg = git.clone_repo(r, dest, use_ssh=ssh, mirror=mirror, shallow=shallow, token=token)
+    parallel = jobs > 1
+    quiet = parallel or reporter.ndjson
+    # One org lives on one host, so a single semaphore caps connections to it.
+    network_slot = threading.BoundedSemaphore(max_connections or jobs) if parallel else None
+    cache = MirrorCache(mirror_cache_dir, mirror_cache_max_mb * 1024 * 1024) if mirror_cache_dir else None
+    used_mirrors: set[str] = set()
+
+    def _clone(r: dict) -> tuple[bool, str | None, dict[str, float], float, int | None, int]:
         name = r["full_name"]
+        target = git.clone_target(r, dest, mirror=mirror)
+        stages: dict[str, float] = {}
+        t0 = time.perf_counter()
+        journal.record(name, CloneState.in_progress)
+        attempt = 0
+        with trace.repo(name, "clone"):
+            while True:
+                ok, msg = git.clone_repo(
+                    r,
+                    dest,
+                    use_ssh=ssh,
+                    mirror=mirror,
+                    shallow=shallow,
+                    token=token,
+                    quiet=quiet,
+                    network_slot=network_slot,
+                    timings=stages,
+                    clone_filter=clone_filter,
+                    sparse=sparse,
+                    cache=cache,
+                    cache_mode=mirror_cache_mode,
+                )
+                if ok or attempt >= retries or not _is_transient(msg):
+                    break
+                with trace.span("retry backoff", "wait", attempt=attempt + 1):
+                    time.sleep(_backoff_delay(attempt, retry_backoff))
+                attempt += 1
+        journal.record(
+            name, CloneState.done if ok else CloneState.failed, attempts=attempt + 1, error=None if ok else msg
+        )
+        if cache is not None:
+            used_mirrors.add(cache.name(r))
+        secs = time.perf_counter() - t0
+        # Checkouts made from the mirror cache receive nothing over the network themselves.
+        size = git.received_pack_bytes(target) if ok and stages and reporter.ndjson and cache is None else None
+        return ok, msg, stages, secs, size, attempt + 1
+
+    def _report(name: str, fut: Future) -> None:
+        nonlocal successes
+        stages, secs, size, attempts = {}, None, None, 1
+        try:
+            ok, msg, stages, secs, size, attempts = fut.result()
+        except Exception as e:
+            ok, msg = False, f"{e!r}"
+            journal.record(name, CloneState.failed, error=msg)
+        status = ("cloned" if stages else "skipped") if ok else "failed"
+        tries = f" after {attempts} attempts" if attempts > 1 else ""
         if ok:
-            print(f"[ok] {name} {('(' + msg + ')') if msg else ''}")
-            successes += 1
+            text = f"[ok] {name} {('(' + msg + ')') if msg else ''}"
+            text = text.rstrip() + tries if tries else text
         else:
-            print(f"[fail] {name}: {msg}", file=sys.stderr)
+            text = f"[fail] {name}{tries}: {msg}"
+        reporter.result(
+            name,
+            status,
+            text=text,
+            error=not ok,
+            duration=secs,
+            size_bytes=size,
+            stages=stages,
+            attempts=attempts,
+        )
+        with report_lock:
+            successes += ok
+
+    # Workers consume the listing as a stream, so time-to-first-clone does not grow with org size.
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for r in gh.iter_org_repos(org, include_archived=include_archived, visibility=visibility):
+                total += 1
+                if journal.state(r["full_name"]) is None:
+                    journal.record(r["full_name"], CloneState.pending)
+                pool.submit(_clone, r).add_done_callback(functools.partial(_report, r["full_name"]))
+    finally:
+        journal.compact()
+        journal.close()
+        if gh.cache is not None:
+            gh.cache.prune()
+        with contextlib.suppress(OSError):
+            os.rmdir(os.path.join(dest, CLONE_STAGING_DIR))  # only if no clone was left unfinished
+
+    if not total:
+        reporter.info("No repositories found (check org name / permissions).")
+        return
 
     secs = time.time() - start
-    print(f"Done. {successes}/{len(repos)} succeeded in {secs:.1f}s.")
+    if cache is not None:
+        evicted = cache.prune(keep=used_mirrors)
+        if evicted:
+            reporter.info(f"Mirror cache: evicted {evicted} least recently used mirror(s).")
+    print_api_metrics(gh, reporter)
+    reporter.summary(f"Done. {successes}/{total} succeeded in {secs:.1f}s.", ok=successes, failed=total - successes)
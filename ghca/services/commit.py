@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from ..core import trace
 from ..core.git_client import GitClient
+from ..core.report import Reporter
+from ..core.types import OutputFormat, RepoState
 
 
 def batch_commit_and_push(
@@ -13,36 +22,114 @@ def batch_commit_and_push(
     sign: bool,
     token: str | None,
     push_no_verify: bool,
+    jobs: int = 1,
+    push_jobs: int | None = None,
+    output_format: str = OutputFormat.text.value,
 ) -> None:
-    """Commit and push changes across repositories under dest."""
+    """Commit and push changes across repositories under dest.
+
+    Runs as a two-stage pipeline: local ``add``/``commit`` on a pool of ``jobs`` workers, and each
+    committed repo is handed straight to a separate pool of ``push_jobs`` workers for ``push``, so a
+    slow push never holds up local commits. Results are printed in repo order (or, with
+    ``output_format="ndjson"``, written as records with commit/push timings).
+    """
     git = GitClient()
+    reporter = Reporter("commit", output_format)
 
     repos = git.find_worktrees(dest)
     if not repos:
-        print("No repositories found to commit/push.")
+        reporter.info("No repositories found to commit/push.")
         return
 
-    print(f"Batch committing to {len(repos)} repositories...")
+    push_jobs = push_jobs or jobs
+    reporter.info(f"Batch committing to {len(repos)} repositories (jobs={jobs}, push-jobs={push_jobs})...")
     committed = pushed = skipped = failed = 0
+    quiet = jobs > 1 or push_jobs > 1 or reporter.ndjson
+
+    def _timed(
+        stage: str, stages: dict[str, float], fn: Callable[..., tuple[bool, str]], *args: Any, **kwargs: Any
+    ) -> tuple[bool, str]:
+        t0 = time.perf_counter()
+        try:
+            with trace.repo(os.path.basename(args[0].rstrip(os.sep)), stage):
+                return fn(*args, **kwargs)
+        finally:
+            stages[stage] = time.perf_counter() - t0
+
+    states = git.probe_many(repos)
+    with ThreadPoolExecutor(max_workers=jobs) as commit_pool, ThreadPoolExecutor(max_workers=push_jobs) as push_pool:
+
+        def _start(d: str, state: RepoState | None) -> tuple[Future, dict[str, float]]:
+            name = os.path.basename(d.rstrip(os.sep))
+            done: Future = Future()
+            stages: dict[str, float] = {}
+
+            def _settle(fut: Future) -> None:
+                try:
+                    done.set_result(fut.result())
+                except Exception as e:
+                    done.set_result((False, f"[fail] {name}: {e!r}"))
+
+            def _after_commit(fut: Future) -> None:
+                try:
+                    ok, msg = fut.result()
+                except Exception as e:
+                    done.set_result((False, f"[fail] {name}: {e!r}"))
+                    return
+                if not ok or msg.startswith("[clean]"):
+                    done.set_result((ok, msg))
+                    return
+                push_pool.submit(
+                    _timed,
+                    "push",
+                    stages,
+                    git.push_one,
+                    d,
+                    branch=branch,
+                    token=token,
+                    push_no_verify=push_no_verify,
+                    quiet=quiet,
+                ).add_done_callback(_settle)
+
+            commit_pool.submit(
+                _timed,
+                "commit",
+                stages,
+                git.commit_one,
+                d,
+                message=message,
+                allow_empty=allow_empty,
+                sign=sign,
+                state=state,
+                quiet=quiet,
+            ).add_done_callback(_after_commit)
+            return done, stages
+
+        results = [(d, *_start(d, state)) for d, state in zip(repos, states, strict=True)]
+        # Report in repo order so output and summary are the same whatever the completion order.
+        for d, fut, stages in results:
+            ok, msg = fut.result()
+            if ok:
+                if msg.startswith("[clean]"):
+                    skipped += 1
+                    status = "clean"
+                elif msg.startswith("[pushed]"):
+                    committed += 1
+                    pushed += 1
+                    status = "pushed"
+                else:
+                    status = "ok"
+            else:
+                failed += 1
+                status = "failed"
+            reporter.result(
+                os.path.basename(d.rstrip(os.sep)), status, text=msg, duration=sum(stages.values()), stages=stages
+            )
 
-    for d in repos:
-        ok, msg = git.commit_and_push_one(
-            repo_dir=d,
-            message=message,
-            branch=branch,
-            allow_empty=allow_empty,
-            sign=sign,
-            token=token,
-            push_no_verify=push_no_verify,
-        )
-        print(msg)
-        if ok:
-            if msg.startswith("[clean]"):
-                skipped += 1
-            elif msg.startswith("[pushed]"):
-                committed += 1
-                pushed += 1
-        else:
-            failed += 1
-
-    print(f"Done. committed={committed}, pushed={pushed}, clean={skipped}, failed={failed}.")
+    reporter.summary(
+        f"Done. committed={committed}, pushed={pushed}, clean={skipped}, failed={failed}.",
+        committed=committed,
+        pushed=pushed,
+        clean=skipped,
+        failed=failed,
+    )
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+from ..core import trace
 from ..core.git_client import GitClient
-from ..core.utils import matches_any_glob
+from ..core.report import Reporter
+from ..core.types import OutputFormat, RepoState
+from ..core.utils import filter_dirs_by_name
 
 
 def _plan_repo_commands(
@@ -49,38 +54,36 @@ def discard_changes_batch(
     exclude_globs: list[str],
     only_dirty: bool,  # skip repos with no changes
     dry_run: bool,
+    jobs: int = 1,
+    output_format: str = OutputFormat.text.value,
 ) -> None:
+    """Reset/restore (and optionally clean) repos under dest, ``jobs`` repos at a time."""
     git = GitClient()
+    reporter = Reporter("discard", output_format)
 
     repos = git.find_worktrees(dest)
     if not repos:
-        print("No repositories found.")
+        reporter.info("No repositories found.")
         return
 
     # Filter by folder name (basename)
-    filtered: list[str] = []
-    for d in repos:
-        name = os.path.basename(d.rstrip(os.sep))
-        if only_globs and not matches_any_glob(name, only_globs):
-            continue
-        if exclude_globs and matches_any_glob(name, exclude_globs):
-            continue
-        filtered.append(d)
+    filtered = filter_dirs_by_name(repos, only_globs, exclude_globs)
 
     if not filtered:
-        print("No repositories remain after filters.")
+        reporter.info("No repositories remain after filters.")
         return
 
-    print(f"Discarding changes in {len(filtered)} repository(ies)...")
+    reporter.info(f"Discarding changes in {len(filtered)} repository(ies) (jobs={jobs})...")
     ok = fail = skipped = 0
+    # Parallel workers capture git's output so concurrent repos don't interleave on the terminal.
+    run = git._run_out if jobs > 1 or reporter.ndjson else git._run
 
-    for d in filtered:
+    def _discard_one(d: str, state: RepoState | None, stages: dict[str, float]) -> tuple[str, list[str]]:
+        """Return (outcome, lines to print); outcome is ok|skipped|failed."""
         name = os.path.basename(d.rstrip(os.sep))
 
-        if only_dirty and (not git.status_has_changes(d)):
-            print(f"[skip] {name}: clean")
-            skipped += 1
-            continue
+        if only_dirty and not (state and state.dirty):
+            return "skipped", [f"[skip] {name}: clean"]
 
         cmds = _plan_repo_commands(
             git=git,
@@ -92,24 +95,39 @@ def discard_changes_batch(
         )
 
         if dry_run:
-            for c in cmds:
-                print(f"[dry-run] {name}: {' '.join(c)}")
-            ok += 1
-            continue
+            return "ok", [f"[dry-run] {name}: {' '.join(c)}" for c in cmds]
 
         # Execute planned commands
-        all_ok = True
         for c in cmds:
-            success, err = git._run(c, cwd=d)  # uses GitClient's runner
+            t0 = time.perf_counter()
+            success, err = run(c, cwd=d)  # uses GitClient's runner
+            stages[c[1]] = time.perf_counter() - t0
             if not success:
-                print(f"[fail] {name}: {' '.join(c)} -> {err}")
-                all_ok = False
-                break
-
-        if all_ok:
-            print(f"[ok] {name}")
-            ok += 1
-        else:
-            fail += 1
+                return "failed", [f"[fail] {name}: {' '.join(c)} -> {err}"]
+        return "ok", [f"[ok] {name}"]
 
-    print(f"Done. ok={ok}, skipped={skipped}, failed={fail}.")
+    def _safe_discard_one(d: str, state: RepoState | None) -> tuple[str, str, list[str], float, dict[str, float]]:
+        name = os.path.basename(d.rstrip(os.sep))
+        stages: dict[str, float] = {}
+        t0 = time.perf_counter()
+        try:
+            with trace.repo(name, "discard"):
+                outcome, lines = _discard_one(d, state, stages)
+        except Exception as e:
+            outcome, lines = "failed", [f"[fail] {name}: {e!r}"]
+        return name, outcome, lines, time.perf_counter() - t0, stages
+
+    # One porcelain-v2 probe per repo, run in parallel, answers the dirty check up front.
+    states = git.probe_many(filtered) if only_dirty else [None] * len(filtered)
+    # pool.map keeps output in repo order regardless of completion order.
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for name, outcome, lines, secs, stages in pool.map(_safe_discard_one, filtered, states):
+            reporter.result(name, outcome, text="\n".join(lines), duration=secs, stages=stages)
+            if outcome == "ok":
+                ok += 1
+            elif outcome == "skipped":
+                skipped += 1
+            else:
+                fail += 1
+
+    reporter.summary(f"Done. ok={ok}, skipped={skipped}, failed={fail}.", ok=ok, skipped=skipped, failed=fail)
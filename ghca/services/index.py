@@ -0,0 +1,28 @@
+"""Service: inspect or rebuild the persistent repository index for a folder."""
+
+from __future__ import annotations
+
+import time
+
+from ..core.git_client import GitClient
+from ..core.repo_index import BARE, WORKTREE
+
+
+def index_repos(*, dest: str, rebuild: bool, max_depth: int | None, show: bool) -> None:
+    """Revalidate (or rebuild) the repo index for dest and report what it holds."""
+    git = GitClient()
+    index = git.repo_index(dest, max_depth=max_depth)
+    start = time.time()
+    found = index.scan(rebuild=rebuild)
+    secs = time.time() - start
+
+    if show:
+        for path, kind in found:
+            print(f"[{kind}] {path}")
+    worktrees = sum(1 for _, kind in found if kind == WORKTREE)
+    bare = sum(1 for _, kind in found if kind == BARE)
+    depth = "unlimited" if index.max_depth is None else index.max_depth
+    print(
+        f"Done. worktrees={worktrees}, bare={bare} (max depth {depth}; "
+        f"visited {index.stats.visited} dir(s), listed {index.stats.listed}) in {secs:.2f}s."
+    )
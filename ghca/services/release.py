@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+from ..core import trace
+from ..core.constants import API_BASE, ASSET_UPLOAD_CONCURRENCY
 from ..core.git_client import GitClient
 from ..core.github_client import GitHubClient, GitHubError
+from ..core.report import Reporter
+from ..core.types import OutputFormat, ReleaseBackend
 from ..core.utils import matches_any_glob, resolve_asset_globs
 
 _VERSION_RE = re.compile(r"(?P<version>\d+\.\d+\.\d+(?:[.-][0-9A-Za-z]+)*)")
@@ -50,49 +58,72 @@ def batch_create_releases(
     auto_from_uv: bool,  # NEW: per-repo version discovery
     tag_prefix: str,  # NEW: prefix for tag (default "")
     tag_suffix: str,  # NEW: prefix for tag (default "")
+    backend: str = ReleaseBackend.api.value,
+    jobs: int = 1,
+    api_base: str = API_BASE,
+    asset_jobs: int = ASSET_UPLOAD_CONCURRENCY,
+    output_format: str = OutputFormat.text.value,
+    resume: bool = False,
 ) -> None:
+    """Create releases across repos via the REST API (default) or the gh CLI, ``jobs`` repos at a time.
+
+    With the API backend, assets are uploaded ``asset_jobs`` at a time and ones already on the release
+    with the same sha256 are skipped, so rerunning after a partial failure only uploads what is missing.
+    A release that already exists and is published is only touched with ``resume`` (missing assets are
+    added, differing ones are refused). Without ``token``, the API backend uses the ``gh auth login``
+    token, and stops before touching any repo if there is none.
+    """
     git = GitClient()
-    gh = GitHubClient(token=token)
+    reporter = Reporter("release", output_format)
+    if backend == ReleaseBackend.api.value and not token:
+        # Logins made only with `gh auth login` work for the API backend too.
+        token = GitHubClient.token_from_gh(api_base)
+        if not token and not dry_run:
+            reporter.info(
+                "Error: no GitHub token; set GITHUB_TOKEN, pass --token, run 'gh auth login' or use --backend gh."
+            )
+            return
+    gh = GitHubClient(token=token, api_base=api_base, asset_concurrency=asset_jobs)
 
     repos = git.find_worktrees(dest)
     if not repos:
-        print("No repositories found.")
+        reporter.info("No repositories found.")
         return
 
     mode = "auto-from-uv" if auto_from_uv else f"fixed tag={tag}"
-    print(f"Creating releases ({mode}) across {len(repos)} repositories...")
+    reporter.info(f"Creating releases ({mode}, backend={backend}, jobs={jobs}) across {len(repos)} repositories...")
     released = skipped = failed = 0
 
-    try:
-        GitHubClient._ensure_gh_available()
-    except GitHubError as e:
-        print(f"Error: {e}")
-        return
-
-    for d in repos:
+    if backend == ReleaseBackend.gh.value:
+        try:
+            GitHubClient._ensure_gh_available()
+        except GitHubError as e:
+            reporter.info(f"Error: {e}")
+            return
+        # Keep stdout pure NDJSON: gh prints the release URL.
+        create = functools.partial(gh.create_release_with_gh, stdout=sys.stderr if reporter.ndjson else None)
+    else:
+        create = functools.partial(gh.create_release, resume=resume)
+
+    def _release_one(d: str, stages: dict[str, float]) -> tuple[str, str, int | None]:
+        """Return (outcome, message, bytes uploaded); outcome is released|skipped|failed|filtered."""
         name = os.path.basename(d.rstrip(os.sep))
 
         if only_globs and not matches_any_glob(name, only_globs):
-            print(f"[skip] {name}: not in --only filter")
-            continue
+            return "filtered", f"[skip] {name}: not in --only filter", None
         if exclude_globs and matches_any_glob(name, exclude_globs):
-            print(f"[skip] {name}: excluded by --exclude")
-            continue
+            return "filtered", f"[skip] {name}: excluded by --exclude", None
 
         origin = git.origin_url(d)
         repo_full = git.parse_repo_full_name(origin)
         if not repo_full:
-            print(f"[skip] {name}: could not parse owner/repo from origin")
-            skipped += 1
-            continue
+            return "skipped", f"[skip] {name}: could not parse owner/repo from origin", None
 
         # Optional guard: skip if no commits since last tag
         if since_last_tag_only:
             last = git.last_tag(d)
             if last and git.commits_since(d, last) == 0:
-                print(f"[skip] {name}: no commits since last tag {last}")
-                skipped += 1
-                continue
+                return "skipped", f"[skip] {name}: no commits since last tag {last}", None
 
         # Resolve assets
         asset_paths = resolve_asset_globs(d, assets)
@@ -102,11 +133,11 @@ def batch_create_releases(
         eff_title = title
 
         if auto_from_uv:
+            t0 = time.perf_counter()
             version = _derive_version_with_uv(git, d)
+            stages["version"] = time.perf_counter() - t0
             if not version:
-                print(f"[skip] {name}: could not derive version via `uv version`")
-                skipped += 1
-                continue
+                return "skipped", f"[skip] {name}: could not derive version via `uv version`", None
             eff_tag = f"{tag_prefix}{version}{tag_suffix}"
             # title = version unless provided explicitly
             eff_title = eff_title or version
@@ -121,11 +152,11 @@ def batch_create_releases(
             eff_prerelease = prerelease
 
         if not eff_tag:
-            print(f"[skip] {name}: tag is empty")
-            skipped += 1
-            continue
+            return "skipped", f"[skip] {name}: tag is empty", None
 
-        ok, msg = gh.create_release_with_gh(
+        t0 = time.perf_counter()
+        stats: dict[str, int] = {}
+        ok, msg = create(
             repo_full=repo_full,
             tag=eff_tag,
             title=eff_title,
@@ -137,11 +168,36 @@ def batch_create_releases(
             asset_paths=asset_paths,
             cwd=d,
             dry_run=dry_run,
+            stats=stats,
         )
-        print(msg)
-        if ok:
-            released += 1
-        else:
-            failed += 1
+        stages["create"] = time.perf_counter() - t0
+        return ("released" if ok else "failed"), (msg if ok else f"[fail] {name}: {msg}"), stats.get("uploaded_bytes")
 
-    print(f"Done. released={released}, skipped={skipped}, failed={failed}.")
+    def _safe_release_one(d: str) -> tuple[str, str, str, float, dict[str, float], int | None]:
+        name = os.path.basename(d.rstrip(os.sep))
+        stages: dict[str, float] = {}
+        t0 = time.perf_counter()
+        try:
+            with trace.repo(name, "release"):
+                outcome, msg, size = _release_one(d, stages)
+        except Exception as e:
+            outcome, msg, size = "failed", f"[fail] {name}: {e!r}", None
+        return name, outcome, msg, time.perf_counter() - t0, stages, size
+
+    # pool.map keeps results in repo order regardless of completion order.
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for name, outcome, msg, secs, stages, size in pool.map(_safe_release_one, repos):
+            reporter.result(name, outcome, text=msg, duration=secs, size_bytes=size, stages=stages)
+            if outcome == "released":
+                released += 1
+            elif outcome == "skipped":
+                skipped += 1
+            elif outcome == "failed":
+                failed += 1
+
+    reporter.summary(
+        f"Done. released={released}, skipped={skipped}, failed={failed}.",
+        released=released,
+        skipped=skipped,
+        failed=failed,
+    )
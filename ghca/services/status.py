@@ -0,0 +1,64 @@
+"""Service: read-only status table across repositories."""
+
+from __future__ import annotations
+
+import os
+
+from ..core.constants import PROBE_CONCURRENCY
+from ..core.git_client import GitClient
+from ..core.utils import filter_dirs_by_name
+
+_COLUMNS = ("REPO", "BRANCH", "UPSTREAM", "AHEAD", "BEHIND", "STAGED", "UNSTAGED", "UNTRACKED")
+
+
+def status_table(
+    *,
+    dest: str,
+    only_globs: list[str],
+    exclude_globs: list[str],
+    dirty_only: bool,
+    jobs: int = PROBE_CONCURRENCY,
+) -> None:
+    """Print branch/upstream/ahead-behind/change counts for every repo under dest."""
+    git = GitClient()
+
+    repos = filter_dirs_by_name(git.find_worktrees(dest), only_globs, exclude_globs)
+    if not repos:
+        print("No repositories found.")
+        return
+
+    rows: list[tuple[str, ...]] = []
+    dirty = ahead = behind = failed = 0
+    for d, state in zip(repos, git.probe_many(repos, jobs=jobs), strict=True):
+        name = os.path.basename(d.rstrip(os.sep))
+        if state is None:
+            failed += 1
+            rows.append((name, "?", "", "", "", "", "", ""))
+            continue
+        dirty += state.dirty
+        ahead += state.ahead > 0
+        behind += state.behind > 0
+        if dirty_only and not state.dirty:
+            continue
+        rows.append(
+            (
+                name,
+                state.branch or "(detached)",
+                state.upstream or "-",
+                str(state.ahead),
+                str(state.behind),
+                str(state.staged),
+                str(state.unstaged),
+                str(state.untracked + state.conflicts),
+            )
+        )
+
+    widths = [max(len(c), *(len(r[i]) for r in rows)) if rows else len(c) for i, c in enumerate(_COLUMNS)]
+    for row in (_COLUMNS, *rows):
+        print(
+            "  ".join(
+                cell.ljust(w) if i < 3 else cell.rjust(w) for i, (cell, w) in enumerate(zip(row, widths, strict=True))
+            )
+        )
+
+    print(f"Done. repos={len(repos)}, dirty={dirty}, ahead={ahead}, behind={behind}, failed={failed}.")
@@ -0,0 +1,149 @@
+"""Service: incrementally bring a checkout tree in line with the org."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ..core import trace
+from ..core.constants import API_BASE, CLONE_STAGING_DIR, PAGE_FETCH_CONCURRENCY, SYNC_STATE_FILE
+from ..core.git_client import GitClient
+from ..core.types import CloneFilter
+from .clone import build_github_client, print_api_metrics
+
+
+def _load_state(path: str) -> dict[str, str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return dict(json.load(f).get("repos", {}))
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_state(path: str, org: str, repos: dict[str, str]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".ghca-sync-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "org": org, "repos": repos}, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def sync_org(
+    *,
+    org: str,
+    dest: str,
+    token: str | None,
+    ssh: bool,
+    mirror: bool,
+    shallow: bool,
+    include_archived: bool,
+    visibility: str,
+    jobs: int = 1,
+    max_connections: int | None = None,
+    force: bool = False,
+    api_base: str = API_BASE,
+    page_jobs: int = PAGE_FETCH_CONCURRENCY,
+    http_cache_dir: str | None = None,
+    http_cache_max_mb: int = 64,
+    clone_filter: str = CloneFilter.full.value,
+    sparse: Sequence[str] = (),
+) -> None:
+    """Clone repos new to the org and fetch only those pushed since the last sync.
+
+    ``pushed_at`` from the org listing is recorded per repo in ``<dest>/.ghca-sync.json``; a repo whose
+    value is unchanged is skipped without touching the network (``force`` fetches everything).
+    New repos are cloned with ``clone_filter`` / ``sparse``; fetches into existing partial clones
+    keep the filter they were cloned with.
+    """
+    os.makedirs(dest, exist_ok=True)
+    state_path = os.path.join(dest, SYNC_STATE_FILE)
+    state = _load_state(state_path)
+
+    gh = build_github_client(
+        token,
+        api_base=api_base,
+        page_jobs=page_jobs,
+        http_cache_dir=http_cache_dir,
+        http_cache_max_mb=http_cache_max_mb,
+    )
+    print(f"Syncing '{org}' into '{dest}' (jobs={jobs})...")
+    start = time.time()
+    counts = {"cloned": 0, "updated": 0, "unchanged": 0, "failed": 0}
+    total = 0
+    lock = threading.Lock()
+
+    git = GitClient()
+    parallel = jobs > 1
+    network_slot = threading.BoundedSemaphore(max_connections or jobs)
+
+    def _sync(r: dict) -> tuple[str, str | None]:
+        with trace.repo(r["full_name"], "sync"):
+            return _sync_one(r)
+
+    def _sync_one(r: dict) -> tuple[str, str | None]:
+        target = git.clone_target(r, dest, mirror=mirror)
+        if not os.path.exists(target):
+            ok, msg = git.clone_repo(
+                r,
+                dest,
+                use_ssh=ssh,
+                mirror=mirror,
+                shallow=shallow,
+                token=token,
+                quiet=parallel,
+                network_slot=network_slot,
+                clone_filter=clone_filter,
+                sparse=sparse,
+            )
+            return ("cloned" if ok else "failed"), msg
+        if not force and r.get("pushed_at") and state.get(r["full_name"]) == r["pushed_at"]:
+            return "unchanged", None
+        with trace.acquire("network slot", network_slot):
+            ok, msg = git.fetch_repo(target, quiet=parallel)
+        return ("updated" if ok else "failed"), msg
+
+    def _report(r: dict, fut: Future) -> None:
+        name = r["full_name"]
+        try:
+            status, msg = fut.result()
+        except Exception as e:
+            status, msg = "failed", f"{e!r}"
+        with lock:
+            counts[status] += 1
+            if status == "failed":
+                print(f"[fail] {name}: {msg}", file=sys.stderr)
+                return
+            if r.get("pushed_at"):
+                state[name] = r["pushed_at"]
+            if status != "unchanged":
+                print(f"[{status}] {name}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for r in gh.iter_org_repos(org, include_archived=include_archived, visibility=visibility):
+                total += 1
+                pool.submit(_sync, r).add_done_callback(functools.partial(_report, r))
+    finally:
+        if gh.cache is not None:
+            gh.cache.prune()
+    with contextlib.suppress(OSError):
+        os.rmdir(os.path.join(dest, CLONE_STAGING_DIR))  # only if no clone was left unfinished
+
+    if not total:
+        print("No repositories found (check org name / permissions).")
+        return
+
+    _save_state(state_path, org, state)
+    secs = time.time() - start
+    print_api_metrics(gh)
+    print(
+        f"Done. cloned={counts['cloned']}, updated={counts['updated']}, "
+        f"unchanged={counts['unchanged']}, failed={counts['failed']} in {secs:.1f}s."
+    )